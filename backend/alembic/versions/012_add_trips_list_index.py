@@ -0,0 +1,31 @@
+"""Add composite index for listing a user's trips
+
+Revision ID: 012_add_trips_list_index
+Revises: 011_add_user_password
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '012_add_trips_list_index'
+down_revision = '011_add_user_password'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # list_trips filters on owner + deleted_at IS NULL (+ optional status) and
+    # pages newest first. MySQL has no partial/INCLUDE indexes, so deleted_at
+    # is a key column instead of a WHERE predicate.
+    op.create_index(
+        'ix_trips_list',
+        'trips',
+        ['created_by', 'deleted_at', 'status', sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_trips_list', table_name='trips')
@@ -0,0 +1,36 @@
+"""Add composite index for keyset pagination of a user's trips
+
+Revision ID: 013_add_trips_keyset_index
+Revises: 012_add_trips_list_index
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013_add_trips_keyset_index'
+down_revision = '012_add_trips_list_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Cursor pages of list_trips seek on (created_at, id) below the last row
+    # seen, for one owner's live trips. Without status between deleted_at and
+    # created_at (as in ix_trips_list) this is a single index range scan.
+    op.create_index(
+        'ix_trips_keyset',
+        'trips',
+        [
+            'created_by',
+            'deleted_at',
+            sa.text('created_at DESC'),
+            sa.text('id DESC'),
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_trips_keyset', table_name='trips')
@@ -0,0 +1,55 @@
+"""Store updated_at with microsecond precision
+
+Revision ID: 014_updated_at_microseconds
+Revises: 013_add_trips_keyset_index
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014_updated_at_microseconds'
+down_revision = '013_add_trips_keyset_index'
+branch_labels = None
+depends_on = None
+
+# Every table whose model uses TimestampMixin
+TABLES = (
+    'users',
+    'user_settings',
+    'trips',
+    'trip_members',
+    'days',
+    'places',
+    'stops',
+    'pins',
+    'route_versions',
+    'route_legs',
+)
+
+
+def upgrade() -> None:
+    # Whole-second DATETIME let two edits within one second leave updated_at,
+    # and so the /trips/{id}/complete ETag, unchanged
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'updated_at',
+            type_=mysql.DATETIME(fsp=6),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'updated_at',
+            type_=sa.DateTime(timezone=True),
+            existing_type=mysql.DATETIME(fsp=6),
+            existing_nullable=False,
+        )
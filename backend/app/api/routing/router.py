@@ -2,20 +2,22 @@
 Routing API router
 """
 import asyncio
+import hashlib
 import logging
 import uuid
+from collections import OrderedDict
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from shapely.geometry import LineString
 from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
 # Import best insertion router
 from app.api.v1.routing.best_insertion import router as best_insertion_router
 from app.core.auth import get_current_user
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_db, release_connection
 from app.models.day import Day
 from app.models.place import Place
 from app.models.route import RouteLeg as RouteLegModel
@@ -61,6 +63,36 @@ router.include_router(
 # In-memory storage for route previews (in production, use Redis)
 route_previews: dict[str, dict[str, Any]] = {}
 
+# Recently computed routes keyed by day + stops fingerprint (in production, use Redis)
+ROUTE_CACHE_MAX_ENTRIES = 256
+route_cache: "OrderedDict[str, tuple[RoutePreview, dict[str, Any]]]" = OrderedDict()
+
+
+def route_fingerprint(stops: list[Stop], request: RouteComputeRequest) -> str:
+    """Hash everything that affects route geometry for a day.
+
+    Only stop identity, order, anchoring and coordinates participate, so edits
+    to notes/durations/stop types keep hitting the cache.
+    """
+    parts = [
+        f"{s.id}|{s.seq}|{s.kind.value}|{int(bool(s.fixed))}|{s.place.lat}|{s.place.lon}"
+        for s in stops
+    ]
+    parts.append(
+        request.model_dump_json(
+            include={"profile", "optimize", "fixed_stop_ids", "options"}
+        )
+    )
+    return hashlib.blake2s("\n".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _cache_route(key: str, preview: RoutePreview, preview_data: dict[str, Any]) -> None:
+    route_cache[key] = (preview, preview_data)
+    route_cache.move_to_end(key)
+    while len(route_cache) > ROUTE_CACHE_MAX_ENTRIES:
+        route_cache.popitem(last=False)
+
+
 # Simple haversine distance in kilometers
 from math import atan2, cos, radians, sin, sqrt
 
@@ -90,16 +122,33 @@ async def compute_route(
     stops = (
         db.query(Stop)
         .join(Place)
+        .options(contains_eager(Stop.place))
         .filter(Stop.day_id == day_id, Stop.deleted_at.is_(None))
         .order_by(Stop.seq)
         .all()
     )
 
+    # Everything below works on the loaded stops; don't pin a pooled
+    # connection while waiting on the routing provider
+    release_connection(db)
+
     if len(stops) < 2:
         raise HTTPException(
             status_code=400, detail="At least 2 stops are required for routing"
         )
 
+    # Nothing material changed since the last computation: reuse it under a
+    # fresh preview token (commit consumes tokens)
+    cache_key = f"route:{day_id}:{route_fingerprint(stops, request)}"
+    cached = route_cache.get(cache_key)
+    if cached is not None:
+        route_cache.move_to_end(cache_key)
+        cached_preview, cached_data = cached
+        preview_token = str(uuid.uuid4())
+        route_previews[preview_token] = dict(cached_data)
+        logger.debug(f"Route cache hit for day {day_id}")
+        return cached_preview.model_copy(update={"preview_token": preview_token})
+
     # Convert stops to route points
     route_points = []
     for stop in stops:
@@ -411,7 +460,7 @@ async def compute_route(
             "coordinates": list(full_geometry.coords),
         }
 
-        return RoutePreview(
+        preview = RoutePreview(
             total_km=total_km,
             total_min=total_min,
             geometry=geometry_geojson,
@@ -432,6 +481,8 @@ async def compute_route(
             proposed_order=[s.id for s in final_stops],
             warnings=warnings,
         )
+        _cache_route(cache_key, preview, route_previews[preview_token])
+        return preview
 
     except RoutingRateLimitError:
         # Map provider rate limit to 429 for the client
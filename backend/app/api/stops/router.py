@@ -4,14 +4,14 @@ Stops API router
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.routing.router import commit_route as routing_commit_route
 from app.api.routing.router import compute_route as routing_compute_route
 from app.core.auth import get_current_user
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.models.day import Day, DayStatus
 from app.models.place import Place as PlaceModel
 from app.models.stop import Stop, StopKind, StopType
@@ -20,6 +20,7 @@ from app.models.user import User
 from app.schemas.bulk import (
     BulkDeleteRequest,
     BulkOperationResult,
+    BulkOperationStatus,
     BulkReorderRequest,
     BulkUpdateRequest,
 )
@@ -41,6 +42,104 @@ from app.services.sequence_manager import SequenceManager
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Server-side recompute settings shared by every stop mutation (read-only)
+_DEFAULT_ROUTE_REQ = RouteComputeRequest(profile="car", optimize=True)
+
+# Bulk update fields that can change a day's route geometry
+_ROUTE_GEOMETRY_FIELDS = frozenset({"seq"})
+
+
+def _owned_stop_ids(db: Session, stop_ids: list[str], user_id: str) -> set[str]:
+    """Return the subset of stop_ids on live trips owned by user_id (one query)."""
+    if not stop_ids:
+        return set()
+    rows = (
+        db.query(Stop.id)
+        .join(Trip, Stop.trip_id == Trip.id)
+        .filter(
+            Stop.id.in_(stop_ids),
+            Trip.created_by == user_id,
+            Trip.deleted_at.is_(None),
+        )
+        .all()
+    )
+    return {row.id for row in rows}
+
+
+def _owned_stop_waypoints(
+    db: Session, stop_ids: list[str], user_id: str
+) -> dict[str, bool]:
+    """Map each of stop_ids on live trips owned by user_id to whether it
+    currently contributes a waypoint to its day's route (one query)."""
+    if not stop_ids:
+        return {}
+    rows = (
+        db.query(Stop.id, Stop.deleted_at, PlaceModel.lat, PlaceModel.lon)
+        .join(Trip, Stop.trip_id == Trip.id)
+        .outerjoin(PlaceModel, Stop.place_id == PlaceModel.id)
+        .filter(
+            Stop.id.in_(stop_ids),
+            Trip.created_by == user_id,
+            Trip.deleted_at.is_(None),
+        )
+        .all()
+    )
+    return {
+        row.id: row.deleted_at is None
+        and row.lat is not None
+        and row.lon is not None
+        for row in rows
+    }
+
+
+async def _recompute_day_routes(day_ids: list[str]) -> None:
+    """Background task: recompute routes for days touched by a bulk operation.
+
+    Runs after the response is sent, so it opens its own session rather than
+    reusing the request-scoped one.
+    """
+    db = SessionLocal()
+    try:
+        for day_id in day_ids:
+            try:
+                await routing_compute_route(day_id, _DEFAULT_ROUTE_REQ, db)
+                logger.info(f"Route recomputed in background for day {day_id}")
+            except Exception as e:
+                logger.warning(
+                    f"Background route recompute failed for day {day_id}: {e}"
+                )
+    finally:
+        db.close()
+
+
+def _queue_route_recompute(
+    background_tasks: BackgroundTasks,
+    result: BulkOperationResult,
+    day_ids: list[str],
+) -> BulkOperationResult:
+    """Schedule route recomputation and report the queued days on the result."""
+    if day_ids:
+        background_tasks.add_task(_recompute_day_routes, day_ids)
+        result.route_recompute_queued = day_ids
+    return result
+
+
+def _committed_days(
+    result: BulkOperationResult, day_by_stop: dict[str, str]
+) -> list[str]:
+    """Days of the route-affecting stops whose change was actually committed.
+
+    Hooks run before the commit, so a failed commit (every item FAILED)
+    must not leave their days queued for recompute.
+    """
+    return sorted(
+        {
+            day_by_stop[item.id]
+            for item in result.items
+            if item.status == BulkOperationStatus.SUCCESS and item.id in day_by_stop
+        }
+    )
+
 
 def ensure_inherited_start_for_next_day(
     trip_id: str, current_day: Day, db: Session
@@ -637,10 +736,7 @@ async def create_stop(
     try:
         logger.info(f"[stops] compute+commit start: action=add day_id={day_id}")
         # Optimize by default, respect fixed anchors from DB
-        compute_req = RouteComputeRequest(
-            profile="car", optimize=True, fixed_stop_ids=None
-        )
-        preview = await routing_compute_route(day_id, compute_req, db)
+        preview = await routing_compute_route(day_id, _DEFAULT_ROUTE_REQ, db)
         commit_req = RouteCommitRequest(
             preview_token=preview.preview_token, name="Default"
         )
@@ -749,10 +845,7 @@ async def update_stop(
     # Server-side compute+commit after stop update
     try:
         logger.info(f"[stops] compute+commit start: action=update day_id={day_id}")
-        compute_req = RouteComputeRequest(
-            profile="car", optimize=True, fixed_stop_ids=None
-        )
-        preview = await routing_compute_route(day_id, compute_req, db)
+        preview = await routing_compute_route(day_id, _DEFAULT_ROUTE_REQ, db)
         commit_req = RouteCommitRequest(
             preview_token=preview.preview_token, name="Default"
         )
@@ -803,10 +896,7 @@ async def delete_stop(
     # Server-side compute+commit after stop delete
     try:
         logger.info(f"[stops] compute+commit start: action=delete day_id={day_id}")
-        compute_req = RouteComputeRequest(
-            profile="car", optimize=True, fixed_stop_ids=None
-        )
-        preview = await routing_compute_route(day_id, compute_req, db)
+        preview = await routing_compute_route(day_id, _DEFAULT_ROUTE_REQ, db)
         commit_req = RouteCommitRequest(
             preview_token=preview.preview_token, name="Default"
         )
@@ -883,10 +973,7 @@ async def reorder_stops(
     # Server-side compute+commit after reorder
     try:
         logger.info(f"[stops] compute+commit start: action=reorder day_id={day_id}")
-        compute_req = RouteComputeRequest(
-            profile="car", optimize=True, fixed_stop_ids=None
-        )
-        preview = await routing_compute_route(day_id, compute_req, db)
+        preview = await routing_compute_route(day_id, _DEFAULT_ROUTE_REQ, db)
         commit_req = RouteCommitRequest(
             preview_token=preview.preview_token, name="Default"
         )
@@ -963,6 +1050,7 @@ async def get_trip_stops_summary(
 @router.delete("/bulk", response_model=BulkOperationResult, status_code=200)
 async def bulk_delete_stops(
     request: BulkDeleteRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -973,7 +1061,7 @@ async def bulk_delete_stops(
 
     **Features:**
     - Delete up to 100 stops at once
-    - Automatic route recomputation after deletion
+    - Automatic route recomputation after deletion (queued in the background)
     - Transactional safety (all or nothing)
     - Permission validation for each stop
     - Detailed results for each operation
@@ -1014,7 +1102,12 @@ async def bulk_delete_stops(
     - Remove multiple unwanted stops
     - Cleanup operations
     """
+    current_user_id = current_user.id
     bulk_service = BulkOperationService(db)
+    # Ownership and waypoint status of every requested stop in one query,
+    # so the hooks never lazy-load a stop's place
+    waypoints = _owned_stop_waypoints(db, request.ids, current_user_id)
+    routed_days: dict[str, str] = {}
 
     async def pre_delete_hook(stop: Stop):
         """Hook to handle stop-specific logic before deletion"""
@@ -1023,26 +1116,30 @@ async def bulk_delete_stops(
 
     async def post_delete_hook(stop: Stop):
         """Hook to handle post-deletion logic"""
-        # Trigger route recomputation for the affected day
-        try:
-            compute_req = RouteComputeRequest(profile="car", optimize=True)
-            await routing_compute_route(stop.day_id, compute_req, db)
-        except Exception as e:
-            logger.warning(f"Failed to recompute route after stop deletion: {e}")
+        # Only deletions that remove a waypoint change the route geometry
+        if waypoints.get(stop.id):
+            routed_days[stop.id] = stop.day_id
 
-    return await bulk_service.bulk_delete(
+    result = await bulk_service.bulk_delete(
         model_class=Stop,
         ids=request.ids,
-        user_id=current_user.id,
+        user_id=current_user_id,
         force=request.force,
         pre_delete_hook=pre_delete_hook,
         post_delete_hook=post_delete_hook,
+        preauthorized_ids=set(waypoints),
+    )
+
+    # Recompute once per affected day, after the response is sent
+    return _queue_route_recompute(
+        background_tasks, result, _committed_days(result, routed_days)
     )
 
 
 @router.patch("/bulk", response_model=BulkOperationResult, status_code=200)
 async def bulk_update_stops(
     request: BulkUpdateRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -1092,6 +1189,7 @@ async def bulk_update_stops(
     - Update notes for multiple stops
     - Reorder multiple stops
     """
+    current_user_id = current_user.id
     bulk_service = BulkOperationService(db)
 
     # Define allowed fields for bulk updates
@@ -1108,23 +1206,28 @@ async def bulk_update_stops(
 
         return update_data
 
+    routed_days: dict[str, str] = {}
+
     async def post_update_hook(stop: Stop, update_data: dict):
         """Hook to handle post-update logic"""
-        # Trigger route recomputation if sequence changed
-        if "seq" in update_data:
-            try:
-                compute_req = RouteComputeRequest(profile="car", optimize=True)
-                await routing_compute_route(stop.day_id, compute_req, db)
-            except Exception as e:
-                logger.warning(f"Failed to recompute route after stop update: {e}")
+        # Only sequence changes move waypoints; notes/duration/type do not
+        if _ROUTE_GEOMETRY_FIELDS.intersection(update_data):
+            routed_days[stop.id] = stop.day_id
 
-    return await bulk_service.bulk_update(
+    update_ids = [u["id"] for u in request.updates if u.get("id")]
+    result = await bulk_service.bulk_update(
         model_class=Stop,
         updates=request.updates,
-        user_id=current_user.id,
+        user_id=current_user_id,
         allowed_fields=allowed_fields,
         pre_update_hook=pre_update_hook,
         post_update_hook=post_update_hook,
+        preauthorized_ids=_owned_stop_ids(db, update_ids, current_user_id),
+    )
+
+    # Recompute once per affected day, after the response is sent
+    return _queue_route_recompute(
+        background_tasks, result, _committed_days(result, routed_days)
     )
 
 
@@ -1132,6 +1235,7 @@ async def bulk_update_stops(
 async def bulk_reorder_stops(
     day_id: str,
     request: BulkReorderRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -1142,7 +1246,7 @@ async def bulk_reorder_stops(
 
     **Features:**
     - Reorder up to 50 stops at once
-    - Automatic route recomputation
+    - Automatic route recomputation (queued in the background)
     - Validates sequence numbers
     - Ensures no duplicate positions
     - Scoped to specific day
@@ -1180,11 +1284,13 @@ async def bulk_reorder_stops(
     - Optimize stop order
     - Reorganize itinerary
     """
+    current_user_id = current_user.id
+
     # Validate day exists and user has access
     day = (
         db.query(Day)
         .join(Trip)
-        .filter(Day.id == day_id, Trip.created_by == current_user.id)
+        .filter(Day.id == day_id, Trip.created_by == current_user_id)
         .first()
     )
 
@@ -1197,26 +1303,16 @@ async def bulk_reorder_stops(
     result = await bulk_service.bulk_reorder(
         model_class=Stop,
         reorder_items=request.items,
-        user_id=current_user.id,
+        user_id=current_user_id,
         sequence_field="seq",
         scope_field="day_id",
         scope_value=day_id,
     )
 
-    # Trigger route recomputation if any reordering was successful
-    if result.successful > 0:
-        try:
-            compute_req = RouteComputeRequest(profile="car", optimize=True)
-            await routing_compute_route(day_id, compute_req, db)
-            logger.info(f"Route recomputed after bulk reorder for day {day_id}")
-        except Exception as e:
-            logger.warning(f"Failed to recompute route after bulk reorder: {e}")
-            # Add warning to result but don't fail the operation
-            result.errors.append(
-                f"Reorder successful but route recomputation failed: {str(e)}"
-            )
-
-    return result
+    # Recompute the day's route in the background if anything moved
+    return _queue_route_recompute(
+        background_tasks, result, [day_id] if result.successful > 0 else []
+    )
 
 
 # Sequence Management Endpoints
@@ -1301,8 +1397,7 @@ async def reorder_stop_sequence(
     # Trigger route recomputation if operation was successful
     if result.get("success"):
         try:
-            compute_req = RouteComputeRequest(profile="car", optimize=True)
-            await routing_compute_route(stop.day_id, compute_req, db)
+            await routing_compute_route(stop.day_id, _DEFAULT_ROUTE_REQ, db)
             logger.info(
                 f"Route recomputed after sequence operation for day {stop.day_id}"
             )
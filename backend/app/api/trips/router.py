@@ -1,23 +1,38 @@
 """
 Trips API router
 """
+import hashlib
 import logging
-import re
+from collections import Counter
+from datetime import date, datetime
+from itertools import groupby
+from operator import attrgetter
 from typing import Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import asc, desc, or_
-from sqlalchemy.orm import Session, joinedload
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import and_, asc, case, desc, func, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
+from ulid import ULID
 
 from app.core.auth_jwt import get_current_user_jwt
 from app.core.database import get_db
+from app.core.datetime_utils import DateTimeStandards
+from app.core.exception_handlers import ResourceNotFoundError
 from app.models.day import Day, DayStatus
-from app.models.stop import Stop
+from app.models.stop import Stop, StopKind
 from app.models.trip import Trip, TripStatus
 from app.models.user import User
 from app.schemas.bulk import BulkDeleteRequest, BulkOperationResult, BulkUpdateRequest
 from app.schemas.day import DayWithAllStops
-from app.schemas.pagination import create_paginated_response, get_base_url
+from app.schemas.pagination import (
+    create_paginated_response,
+    decode_cursor,
+    encode_cursor,
+    get_base_url,
+)
 from app.schemas.stop import Stop as StopSchema
 from app.schemas.trip import Trip as TripSchema
 from app.schemas.trip import (
@@ -34,19 +49,199 @@ from app.services.bulk_operations import BulkOperationService
 
 def generate_slug(title: str) -> str:
     """Generate a URL-friendly slug from a title"""
-    # Convert to lowercase and replace spaces/special chars with hyphens
-    slug = re.sub(r"[^\w\s-]", "", title.lower())
-    slug = re.sub(r"[-\s]+", "-", slug)
+    # Single pass: keep word characters, fold runs of spaces/hyphens into one
+    # hyphen and drop everything else (same result as the two regex passes
+    # r"[^\w\s-]" -> "" then r"[-\s]+" -> "-", without copying twice)
+    chars = []
+    in_separator = False
+    for ch in title.lower():
+        if ch.isalnum() or ch == "_":
+            chars.append(ch)
+            in_separator = False
+        elif ch == "-" or ch.isspace():
+            if not in_separator:
+                chars.append("-")
+                in_separator = True
     # Remove leading/trailing hyphens
-    slug = slug.strip("-")
+    slug = "".join(chars).strip("-")
     # Limit length
     return slug[:100] if slug else "untitled-trip"
 
 
-router = APIRouter()
+# (minimum days until the trip starts, planning suggestion), first match wins
+_PLANNING_TIERS = (
+    (31, "You have plenty of time to plan - consider researching seasonal activities"),
+    (8, "Start finalizing your itinerary and booking accommodations"),
+    (0, "Trip is coming up soon - finalize your route and check weather"),
+)
+
+# list_trips sort_by values -> (field, column, direction)
+_SORT_ORDERS = {
+    f"{field}:{name}": (field, column, direction)
+    for field, column in (
+        ("created_at", Trip.created_at),
+        ("updated_at", Trip.updated_at),
+        ("title", Trip.title),
+        ("start_date", Trip.start_date),
+        ("status", Trip.status),
+    )
+    for name, direction in (("asc", asc), ("desc", desc))
+}
+
+
+# delete_trip confirmation body, encoded once
+_TRIP_DELETED_BODY = orjson.dumps({"message": "Trip deleted"})
+
+# Column values copied into the complete-trip day and stop schemas. Reading
+# them by attribute name loads anything expired or deferred instead of
+# silently leaving it out, as copying the instance __dict__ would
+_DAY_COLUMNS = tuple(column.key for column in Day.__table__.columns)
+_STOP_COLUMNS = tuple(column.key for column in Stop.__table__.columns)
+
+# Endpoints that only talk to the (synchronous) Session are plain `def`, so
+# FastAPI runs them in its threadpool instead of blocking the event loop.
+# Responses are rendered with orjson, which matters for the nested
+# complete-trip graph.
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 
+def _commit_keeping_loaded(db: Session) -> None:
+    """Commit everything pending without expiring the objects already loaded"""
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
+def _update_owned_trip(db: Session, match, user_id: str, values: dict) -> bool:
+    """Apply values to the live trip matching `match` and owned by user_id.
+
+    Runs a single UPDATE with ownership enforced in the WHERE clause and
+    commits it without expiring the session, so the caller's already loaded
+    User stays usable for the reload. Returns False (nothing written) when
+    no such trip exists.
+    """
+    result = db.execute(
+        update(Trip)
+        .where(match, Trip.created_by == user_id, Trip.deleted_at.is_(None))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        return False
+    _commit_keeping_loaded(db)
+    return True
+
+
+def _is_slug_collision(error: IntegrityError) -> bool:
+    """Whether an IntegrityError is uq_trip_slug_creator rejecting a taken slug"""
+    # MySQL names the key ("... for key 'trips.uq_trip_slug_creator'"); SQLite
+    # lists its columns ("UNIQUE constraint failed: trips.slug, trips.created_by")
+    message = str(error.orig) if error.orig else str(error)
+    return (
+        "uq_trip_slug_creator" in message or "trips.slug, trips.created_by" in message
+    )
+
+
+def _free_slug(db: Session, user_id: str, base_slug: str) -> str:
+    """Return the first of base_slug, base_slug-1, ... not used by the user"""
+    # Fetch base_slug and its "-N" variants for this user in one query (not
+    # every slug sharing the prefix); soft-deleted trips still hold theirs
+    # under uq_trip_slug_creator
+    taken_slugs = {
+        row.slug
+        for row in db.query(Trip.slug).filter(
+            Trip.created_by == user_id,
+            or_(
+                Trip.slug == base_slug,
+                Trip.slug.startswith(f"{base_slug}-", autoescape=True),
+            ),
+        )
+    }
+
+    slug = base_slug
+    counter = 1
+    while slug in taken_slugs:
+        slug = f"{base_slug}-{counter}"
+        counter += 1
+    return slug
+
+
+def _list_query_params(
+    status: Optional[TripStatus],
+    owner: Optional[str],
+    sort_by: Optional[str],
+    fmt: str,
+    include_total: bool = True,
+) -> dict:
+    """Query parameters list_trips carries over into its pagination links"""
+    query_params = {}
+    if status:
+        query_params["status"] = status.value
+    if owner:
+        query_params["owner"] = owner
+    if sort_by and sort_by != "created_at:desc":  # Only include if not default
+        query_params["sort_by"] = sort_by
+    if fmt != "legacy":  # Keep following links in the same response format
+        query_params["format"] = fmt
+    if not include_total:  # Keep skipping the count on following pages
+        query_params["include_total"] = "false"
+    return query_params
+
+
+def _load_trip(db: Session, *criteria) -> Optional[Trip]:
+    """Load a live trip with its creator for the response body"""
+    return (
+        db.query(Trip)
+        .options(joinedload(Trip.created_by_user))
+        .filter(*criteria, Trip.deleted_at.is_(None))
+        .first()
+    )
+
+
+def _load_owned_trip(db: Session, match, owner: User) -> Optional[Trip]:
+    """Load a live trip owned by owner for the response body.
+
+    created_by_user resolves to the already loaded owner through the
+    session's identity map, so unlike _load_trip this needs no users JOIN.
+    """
+    return (
+        db.query(Trip)
+        .filter(match, Trip.created_by == owner.id, Trip.deleted_at.is_(None))
+        .first()
+    )
+
+
+def _trip_content_etag(db: Session, trip: Trip) -> str:
+    """Strong ETag for a trip together with its live days and stops.
+
+    Days and stops change without touching trips.updated_at, so their
+    counts and latest updated_at are folded in with one aggregate query.
+    updated_at is stored to the microsecond, so every write moves it.
+    """
+    day_count, day_updated, stop_count, stop_updated = (
+        db.query(
+            func.count(func.distinct(Day.id)),
+            func.max(Day.updated_at),
+            func.count(Stop.id),
+            func.max(Stop.updated_at),
+        )
+        .select_from(Day)
+        .outerjoin(Stop, and_(Stop.day_id == Day.id, Stop.deleted_at.is_(None)))
+        .filter(Day.trip_id == trip.id, Day.deleted_at.is_(None))
+        .one()
+    )
+    fingerprint = (
+        f"{trip.id}:{trip.updated_at.isoformat()}:"
+        f"{day_count}:{day_updated}:{stop_count}:{stop_updated}"
+    )
+    return '"' + hashlib.sha256(fingerprint.encode()).hexdigest() + '"'
+
+
 @router.post(
     "/",
     response_model=TripSchema,
@@ -157,7 +352,7 @@ logger = logging.getLogger(__name__)
         },
     },
 )
-async def create_trip(
+def create_trip(
     trip_data: TripCreate,
     current_user: User = Depends(get_current_user_jwt),
     db: Session = Depends(get_db),
@@ -175,51 +370,49 @@ async def create_trip(
 
     # Generate slug from title
     base_slug = generate_slug(trip_data.title)
-    slug = base_slug
-    counter = 1
 
-    # Ensure slug is unique for this user
-    while True:
-        existing_trip = (
-            db.query(Trip)
-            .filter(
-                Trip.slug == slug,
-                Trip.created_by == current_user_id,
-                Trip.deleted_at.is_(None),
-            )
-            .first()
-        )
-
-        if not existing_trip:
-            break
-
-        # If slug exists, append a number
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-
-    # Create trip
-    trip = Trip(
-        slug=slug,
-        title=trip_data.title,
-        destination=trip_data.destination,
-        start_date=trip_data.start_date,
-        timezone=trip_data.timezone,
-        status=trip_data.status,
-        is_published=trip_data.is_published,
-        created_by=current_user_id,
-    )
-
-    db.add(trip)
-    db.commit()
-    db.refresh(trip)
+    trip_fields = {
+        "title": trip_data.title,
+        "destination": trip_data.destination,
+        "start_date": trip_data.start_date,
+        "timezone": trip_data.timezone,
+        "status": trip_data.status,
+        "is_published": trip_data.is_published,
+        "created_by": current_user_id,
+    }
 
-    # Load the user relationship
-    trip = (
-        db.query(Trip)
-        .options(joinedload(Trip.created_by_user))
-        .filter(Trip.id == trip.id)
-        .first()
-    )
+    # Most titles are new for the user, so insert under the bare slug and let
+    # uq_trip_slug_creator reject collisions; only then look up a free suffix.
+    # The creator is the loaded current_user and a new trip has no members,
+    # so both relationships are set here rather than loaded for the response.
+    def insert_trip(slug: str) -> Trip:
+        trip = Trip(slug=slug, created_by_user=current_user, members=[], **trip_fields)
+        db.add(trip)
+        db.flush()
+        return trip
+
+    # Any other integrity failure is not a slug problem: re-raise it for the
+    # IntegrityError handler instead of retrying under another slug
+    try:
+        trip = insert_trip(base_slug)
+    except IntegrityError as e:
+        db.rollback()
+        if not _is_slug_collision(e):
+            raise
+        free_slug = _free_slug(db, current_user_id, base_slug)
+        try:
+            trip = insert_trip(free_slug)
+        except IntegrityError as e:
+            db.rollback()
+            if not _is_slug_collision(e):
+                raise
+            # A concurrent create took the same suffix; a random ULID tail
+            # will not collide again
+            trip = insert_trip(f"{free_slug[:93]}-{str(ULID())[-6:].lower()}")
+
+    # Every column was filled client-side at flush, so commit without expiring
+    # and serialize the response without reloading the row
+    _commit_keeping_loaded(db)
 
     # Generate next steps and suggestions
     next_steps = []
@@ -245,21 +438,11 @@ async def create_trip(
 
     # Add time-based suggestions
     if trip.start_date:
-        from datetime import date
-
         days_until_trip = (trip.start_date - date.today()).days
-        if days_until_trip > 30:
-            suggestions[
-                "planning_timeline"
-            ] = "You have plenty of time to plan - consider researching seasonal activities"
-        elif days_until_trip > 7:
-            suggestions[
-                "planning_timeline"
-            ] = "Start finalizing your itinerary and booking accommodations"
-        elif days_until_trip >= 0:
-            suggestions[
-                "planning_timeline"
-            ] = "Trip is coming up soon - finalize your route and check weather"
+        for min_days, message in _PLANNING_TIERS:
+            if days_until_trip >= min_days:
+                suggestions["planning_timeline"] = message
+                break
 
     return trip
 
@@ -372,7 +555,7 @@ async def create_trip(
         },
     },
 )
-async def list_trips(
+def list_trips(
     request: Request,
     status: Optional[TripStatus] = Query(None, description="Filter by trip status"),
     owner: Optional[str] = Query(
@@ -380,6 +563,14 @@ async def list_trips(
     ),
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     size: int = Query(20, ge=1, le=100, description="Number of trips per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor from meta.next_cursor; replaces page (created_at sorts only)",
+    ),
+    include_total: Optional[bool] = Query(
+        None,
+        description="Count all matching trips; false skips the count and leaves the total null while more pages remain (default: count, except on cursor pages)",
+    ),
     sort_by: Optional[str] = Query(
         "created_at:desc",
         description="Sort by field:direction (created_at:desc, updated_at:desc, title:asc, start_date:desc)",
@@ -409,6 +600,8 @@ async def list_trips(
     - `owner`: Filter by owner ID (defaults to your trips)
     - `page`: Page number (starts at 1)
     - `size`: Number of trips per page (1-100)
+    - `cursor`: Continue after the page that returned this `next_cursor` instead of using `page`; deep pages stay fast (created_at sorts only)
+    - `include_total`: Set to false to skip counting all matching trips; the total (and last link) is then null until the final page. Cursor pages skip the count unless this is set to true
     - `sort_by`: Sort by field:direction (created_at:desc, updated_at:desc, title:asc, start_date:desc) - defaults to newest first
     - `format`: Response format - 'modern' (default), 'legacy', or 'short'
 
@@ -424,7 +617,8 @@ async def list_trips(
         "has_next": true,
         "has_prev": false,
         "from_item": 1,
-        "to_item": 20
+        "to_item": 20,
+        "next_cursor": "eyJ0cyI6IjIwMjQtMDEtMTVUMTA6MzA6MDAiLCJpZCI6IjAxSzRBSFBLNFMxS1ZUWURCNUFTVEdUTThLIn0"
       },
       "links": {
         "self": "http://localhost:8000/trips?page=1&size=20",
@@ -440,9 +634,39 @@ async def list_trips(
     """
     current_user_id = current_user.id
 
+    if format == "short":
+        # TripShort reads no relationships and only these columns (created_at
+        # orders the page and feeds the cursor)
+        loader_options = [
+            load_only(
+                Trip.id,
+                Trip.slug,
+                Trip.title,
+                Trip.destination,
+                Trip.start_date,
+                Trip.timezone,
+                Trip.status,
+                Trip.is_published,
+                Trip.created_by,
+                Trip.created_at,
+            )
+        ]
+    else:
+        # selectinload: one small IN query each for the page's owners and
+        # members instead of widening every page row with JOINs; owners are
+        # trimmed to the TripCreator columns so password hashes are never read
+        loader_options = [
+            selectinload(Trip.created_by_user).load_only(
+                User.id, User.email, User.display_name
+            ),
+            selectinload(Trip.members),
+        ]
+
+    # raiseload("*") turns any other relationship touched during serialization
+    # into an error rather than a silent per-trip lazy load
     query = (
         db.query(Trip)
-        .options(joinedload(Trip.created_by_user))
+        .options(*loader_options, raiseload("*"))
         .filter(Trip.deleted_at.is_(None))
     )
 
@@ -450,141 +674,179 @@ async def list_trips(
     if status:
         query = query.filter(Trip.status == status)
 
-    if owner:
-        query = query.filter(Trip.created_by == owner)
-    else:
-        # Default to current user's trips
-        query = query.filter(Trip.created_by == current_user_id)
-
-    # Apply sorting
-    allowed_sort_fields = {
-        "created_at": Trip.created_at,
-        "updated_at": Trip.updated_at,
-        "title": Trip.title,
-        "start_date": Trip.start_date,
-        "status": Trip.status,
-    }
+    # Default to current user's trips
+    query = query.filter(Trip.created_by == (owner or current_user_id))
 
-    # Parse sort_by parameter (format: field:direction)
-    sort_field = "created_at"
-    sort_direction = "desc"
+    # Resolve sort_by (format: field:direction); anything unknown falls back
+    # to newest first
+    sort_field, field_attr, order = _SORT_ORDERS.get(
+        (sort_by or "").lower(), _SORT_ORDERS["created_at:desc"]
+    )
 
-    if sort_by:
-        try:
-            parts = sort_by.split(":")
-            if len(parts) == 2:
-                field, direction = parts
-                if field in allowed_sort_fields and direction.lower() in [
-                    "asc",
-                    "desc",
-                ]:
-                    sort_field = field
-                    sort_direction = direction.lower()
-        except Exception:
-            # Use defaults if parsing fails
-            pass
-
-    # Apply sorting to query
-    field_attr = allowed_sort_fields[sort_field]
-    if sort_direction == "desc":
-        query = query.order_by(desc(field_attr))
+    # Apply sorting to query; created_at sorts break ties on id so that the
+    # order is total and a (created_at, id) cursor identifies a position
+    keyset = sort_field == "created_at"
+    if keyset:
+        query = query.order_by(order(Trip.created_at), order(Trip.id))
     else:
-        query = query.order_by(asc(field_attr))
-
-    # Get total count
-    total = query.count()
+        query = query.order_by(order(field_attr))
 
-    # Apply pagination
-    offset = (page - 1) * size
-    trips = query.offset(offset).limit(size).all()
+    if cursor is not None:
+        if not keyset:
+            raise HTTPException(
+                status_code=400,
+                detail="cursor pagination requires sort_by=created_at:asc or created_at:desc",
+            )
+        try:
+            after = decode_cursor(cursor)
+            after_ts = datetime.fromisoformat(after["ts"])
+            after_id = str(after["id"])
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+        # The page is an index seek past the last row seen instead of an
+        # OFFSET scan over everything before it; the total ignores the cursor
+        # and is only counted when asked for explicitly, as it costs a scan
+        total = query.count() if include_total else None
+        if order is desc:
+            past_cursor = or_(
+                Trip.created_at < after_ts,
+                and_(Trip.created_at == after_ts, Trip.id < after_id),
+            )
+        else:
+            past_cursor = or_(
+                Trip.created_at > after_ts,
+                and_(Trip.created_at == after_ts, Trip.id > after_id),
+            )
+        rows = query.filter(past_cursor).limit(size + 1).all()
+        has_more = len(rows) > size
+        trips = rows[:size]
+    elif include_total is False:
+        # One extra row tells whether another page follows; the total is
+        # only known once the last page is reached
+        offset = (page - 1) * size
+        rows = query.offset(offset).limit(size + 1).all()
+        has_more = len(rows) > size
+        trips = rows[:size]
+        if has_more or (offset and not trips):
+            total = None
+        else:
+            total = offset + len(trips)
+    else:
+        # Fetch the page and the filtered total in one statement: COUNT(*) OVER ()
+        # is evaluated before OFFSET/LIMIT, so every row carries the full total
+        offset = (page - 1) * size
+        rows = (
+            query.add_columns(func.count().over().label("total"))
+            .offset(offset)
+            .limit(size)
+            .all()
+        )
+        trips = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Past the last page there is no row to read the total from
+            total = query.count()
+        else:
+            total = 0
+        has_more = offset + len(trips) < total
+
+    # Hand out a cursor for the next page whenever keyset paging is possible
+    next_cursor = None
+    if keyset and has_more and trips:
+        last = trips[-1]
+        next_cursor = encode_cursor(
+            {"ts": last.created_at.isoformat(), "id": last.id}
+        )
 
     # Support legacy, modern, and short response formats
     if format == "legacy":
-        return TripList(trips=trips, total=total, page=page, size=size)
+        return TripList(
+            trips=trips, total=total, page=page, size=size, next_cursor=next_cursor
+        )
+
+    # Shared by the short and modern navigation links
+    base_url = get_base_url(request, "/trips")
+    query_params = _list_query_params(
+        status, owner, sort_by, format, include_total is not False
+    )
 
     if format == "short":
         # Get trip IDs for day/stop queries
         trip_ids = [trip.id for trip in trips]
 
+        # Load the days of every trip on the page in one query, and one
+        # aggregated row (count, has START, has END) per day in a second one
+        days_by_trip = {}
+        if trip_ids:
+            for day in (
+                db.query(Day.id, Day.trip_id, Day.seq)
+                .filter(Day.trip_id.in_(trip_ids), Day.deleted_at.is_(None))
+                .order_by(Day.trip_id, Day.seq)
+            ):
+                days_by_trip.setdefault(day.trip_id, []).append(day)
+
+        day_ids = [day.id for days in days_by_trip.values() for day in days]
+        stop_stats = {}
+        if day_ids:
+            for day_id, stop_count, has_start, has_end in (
+                db.query(
+                    Stop.day_id,
+                    func.count(Stop.id),
+                    func.max(case((Stop.kind == StopKind.START, 1), else_=0)),
+                    func.max(case((Stop.kind == StopKind.END, 1), else_=0)),
+                )
+                .filter(Stop.day_id.in_(day_ids), Stop.deleted_at.is_(None))
+                .group_by(Stop.day_id)
+            ):
+                stop_stats[day_id] = (stop_count, bool(has_start), bool(has_end))
+
         # Get day counts and summaries for all trips
         trip_short_data = []
 
         for trip in trips:
-            # Get days for this trip
-            days = (
-                db.query(Day)
-                .filter(Day.trip_id == trip.id, Day.deleted_at.is_(None))
-                .order_by(Day.seq)
-                .all()
-            )
-
-            # Get stops for all days of this trip
-            day_ids = [day.id for day in days]
-            stops_by_day = {}
-
-            if day_ids:
-                stops = (
-                    db.query(Stop)
-                    .filter(Stop.day_id.in_(day_ids), Stop.deleted_at.is_(None))
-                    .all()
-                )
+            days = days_by_trip.get(trip.id, [])
 
-                # Group stops by day_id
-                for stop in stops:
-                    if stop.day_id not in stops_by_day:
-                        stops_by_day[stop.day_id] = []
-                    stops_by_day[stop.day_id].append(stop)
-
-            # Build day summaries as a list of DaySummary objects
+            # Every value below already has its schema type, so construct the
+            # models without validation; FastAPI validates the response once
+            # against response_model anyway
             days_data = []
             for day in days:
-                day_stops = stops_by_day.get(day.id, [])
+                stop_count, has_start, has_end = stop_stats.get(
+                    day.id, (0, False, False)
+                )
 
-                # Check for start and end stops
-                has_start = any(
-                    stop.kind.value.lower() == "start" for stop in day_stops
+                days_data.append(
+                    DaySummary.model_construct(
+                        day=day.seq, start=has_start, stops=stop_count, end=has_end
+                    )
                 )
-                has_end = any(stop.kind.value.lower() == "end" for stop in day_stops)
 
-                # Create DaySummary object
-                day_summary = DaySummary(
-                    day=day.seq, start=has_start, stops=len(day_stops), end=has_end
+            trip_short_data.append(
+                TripShort.model_construct(
+                    id=str(trip.id),
+                    slug=str(trip.slug),
+                    title=str(trip.title),
+                    destination=str(trip.destination)
+                    if trip.destination is not None
+                    else None,
+                    start_date=trip.start_date.isoformat()
+                    if trip.start_date is not None
+                    else None,
+                    timezone=str(trip.timezone)
+                    if trip.timezone is not None
+                    else None,
+                    status=TripStatus(trip.status),
+                    is_published=bool(trip.is_published),
+                    created_by=str(trip.created_by),
+                    members=[],  # TODO: Implement members when available
+                    total_days=len(days),
+                    days=days_data,
                 )
-                days_data.append(day_summary)
-
-            # Create trip short data
-            trip_short = TripShort(
-                id=str(trip.id),
-                slug=str(trip.slug),
-                title=str(trip.title),
-                destination=str(trip.destination)
-                if trip.destination is not None
-                else None,
-                start_date=trip.start_date.isoformat()
-                if trip.start_date is not None
-                else None,
-                timezone=str(trip.timezone) if trip.timezone is not None else None,
-                status=trip.status,
-                is_published=bool(trip.is_published),
-                created_by=str(trip.created_by),
-                members=[],  # TODO: Implement members when available
-                total_days=len(days),
-                days=days_data,
             )
 
-            trip_short_data.append(trip_short)
-
         # Create paginated response for short format
-        base_url = get_base_url(request, "/trips")
-        query_params = {}
-        if status:
-            query_params["status"] = status.value
-        if owner:
-            query_params["owner"] = owner
-        if sort_by and sort_by != "created_at:desc":
-            query_params["sort_by"] = sort_by
-        query_params["format"] = "short"
-
         paginated_response = create_paginated_response(
             items=trip_short_data,
             total_items=total,
@@ -592,24 +854,18 @@ async def list_trips(
             per_page=size,
             base_url=base_url,
             query_params=query_params,
+            next_cursor=next_cursor,
+            has_next=has_more,
+            cursor=cursor,
         )
 
-        return TripShortResponse(
+        return TripShortResponse.model_construct(
             data=trip_short_data,
             meta=paginated_response.meta.model_dump(),
             links=paginated_response.links.model_dump(),
         )
 
     # Modern response with navigation links
-    base_url = get_base_url(request, "/trips")
-    query_params = {}
-    if status:
-        query_params["status"] = status.value
-    if owner:
-        query_params["owner"] = owner
-    if sort_by and sort_by != "created_at:desc":  # Only include if not default
-        query_params["sort_by"] = sort_by
-
     return create_paginated_response(
         items=trips,
         total_items=total,
@@ -617,35 +873,41 @@ async def list_trips(
         per_page=size,
         base_url=base_url,
         query_params=query_params,
+        next_cursor=next_cursor,
+        has_next=has_more,
+        cursor=cursor,
     )
 
 
 @router.get("/{trip_id}", response_model=TripSchema)
-async def get_trip(
+def get_trip(
     trip_id: str,
     current_user: User = Depends(get_current_user_jwt),
     db: Session = Depends(get_db),
 ):
     """Get a specific trip"""
-    trip = (
-        db.query(Trip)
-        .options(joinedload(Trip.created_by_user))
-        .filter(or_(Trip.id == trip_id, Trip.slug == trip_id), Trip.deleted_at.is_(None))
+    match = or_(Trip.id == trip_id, Trip.slug == trip_id)
+
+    # Filter by owner in SQL so another user's trip is never loaded (and a
+    # slug shared with another user cannot shadow the caller's own trip)
+    trip = _load_owned_trip(db, match, current_user)
+    if trip:
+        return trip
+
+    # Nothing of ours matched: a cheap id-only probe tells 404 from 403
+    if (
+        db.query(Trip.id)
+        .filter(match, Trip.deleted_at.is_(None))
         .first()
-    )
-
-    if not trip:
+        is None
+    ):
         raise HTTPException(status_code=404, detail="Trip not found")
 
-    # Check if user has access to this trip
-    if trip.created_by != current_user.id:
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    return trip
+    raise HTTPException(status_code=403, detail="Access denied")
 
 
 @router.patch("/{trip_id}", response_model=TripSchema)
-async def update_trip(
+def update_trip(
     trip_id: str,
     trip_data: TripUpdate,
     current_user: User = Depends(get_current_user_jwt),
@@ -660,89 +922,84 @@ async def update_trip(
 
     **Note:** Updating the start_date will affect all day dates in the trip.
     """
-    trip = (
-        db.query(Trip)
-        .options(joinedload(Trip.created_by_user))
-        .filter(or_(Trip.id == trip_id, Trip.slug == trip_id), Trip.deleted_at.is_(None))
-        .first()
-    )
-
-    if not trip:
-        from app.core.exception_handlers import ResourceNotFoundError
-
-        raise ResourceNotFoundError("Trip", trip_id)
-
-    # Verify ownership
-    if trip.created_by != current_user.id:
-        raise HTTPException(
-            status_code=403, detail="Not authorized to update this trip"
-        )
+    current_user_id = current_user.id
 
-    # Update fields
     update_data = trip_data.model_dump(exclude_unset=True)
     # Ensure start_date is a Python date for DB (avoid serialized string)
     if "start_date" in update_data and isinstance(update_data["start_date"], str):
-        from datetime import date as _date
         try:
-            update_data["start_date"] = _date.fromisoformat(update_data["start_date"])
+            update_data["start_date"] = date.fromisoformat(update_data["start_date"])
         except ValueError:
             # Invalid date string -> reject with validation error
             raise HTTPException(status_code=422, detail="Invalid date format for start_date; expected YYYY-MM-DD")
 
-    for field, value in update_data.items():
-        setattr(trip, field, value)
+    # Single owner-scoped UPDATE of just the provided fields
+    match = or_(Trip.id == trip_id, Trip.slug == trip_id)
+    if not update_data or not _update_owned_trip(
+        db, match, current_user_id, update_data
+    ):
+        # Nothing written: tell "missing" apart from "not yours"
+        trip = _load_trip(db, match)
+        if not trip:
+            raise ResourceNotFoundError("Trip", trip_id)
+
+        if trip.created_by != current_user_id:
+            raise HTTPException(
+                status_code=403, detail="Not authorized to update this trip"
+            )
 
-    db.commit()
-    db.refresh(trip)
+        return trip
 
-    return trip
+    # A slug reference may have just been renamed
+    new_slug = update_data.get("slug", trip_id)
+    return _load_owned_trip(
+        db, or_(Trip.id == trip_id, Trip.slug == new_slug), current_user
+    )
 
 
 @router.put("/{trip_id}", response_model=TripSchema)
-async def replace_trip(
+def replace_trip(
     trip_id: str,
     trip_data: TripUpdate,
     current_user: User = Depends(get_current_user_jwt),
     db: Session = Depends(get_db),
 ):
     """Full update (PUT) is treated the same as PATCH for compatibility."""
-    return await update_trip(trip_id, trip_data, current_user, db)
+    return update_trip(trip_id, trip_data, current_user, db)
 
 
 @router.post("/{trip_id}/archive", response_model=TripSchema)
-async def archive_trip(trip_id: str, db: Session = Depends(get_db)):
+def archive_trip(
+    trip_id: str,
+    current_user: User = Depends(get_current_user_jwt),
+    db: Session = Depends(get_db),
+):
     """Archive a trip"""
-    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.deleted_at.is_(None)).first()
-
-    if not trip:
-        from app.core.exception_handlers import ResourceNotFoundError
-
+    if not _update_owned_trip(
+        db, Trip.id == trip_id, current_user.id, {"status": TripStatus.ARCHIVED}
+    ):
         raise ResourceNotFoundError("Trip", trip_id)
 
-    trip.status = TripStatus.ARCHIVED
-    db.commit()
-    db.refresh(trip)
-
-    return trip
+    return _load_owned_trip(db, Trip.id == trip_id, current_user)
 
 
 @router.post("/{trip_id}/publish", response_model=TripSchema, status_code=200)
-async def publish_trip(trip_id: str, db: Session = Depends(get_db)):
+def publish_trip(
+    trip_id: str,
+    current_user: User = Depends(get_current_user_jwt),
+    db: Session = Depends(get_db),
+):
     """Publish a trip"""
-    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.deleted_at.is_(None)).first()
-
-    if not trip:
+    if not _update_owned_trip(
+        db, Trip.id == trip_id, current_user.id, {"is_published": True}
+    ):
         raise HTTPException(status_code=404, detail="Trip not found")
 
-    trip.is_published = True
-    db.commit()
-    db.refresh(trip)
-
-    return trip
+    return _load_owned_trip(db, Trip.id == trip_id, current_user)
 
 
 @router.delete("/{trip_id}", status_code=200)
-async def delete_trip(
+def delete_trip(
     trip_id: str,
     current_user: User = Depends(get_current_user_jwt),
     db: Session = Depends(get_db),
@@ -756,30 +1013,19 @@ async def delete_trip(
 
     **Authentication Required:** You must be the trip owner.
     """
-    # Find trip and verify ownership
-    trip = (
-        db.query(Trip)
-        .filter(
-            or_(Trip.id == trip_id, Trip.slug == trip_id),
-            Trip.created_by == current_user.id,
-            Trip.deleted_at.is_(None),
-        )
-        .first()
-    )
-
-    if not trip:
-        from app.core.exception_handlers import ResourceNotFoundError
-
+    # Soft delete the trip (cascade will handle days, stops, routes) with one
+    # ownership-checked UPDATE; nothing needs to be loaded first
+    if not _update_owned_trip(
+        db,
+        or_(Trip.id == trip_id, Trip.slug == trip_id),
+        current_user.id,
+        {"deleted_at": DateTimeStandards.now_utc()},
+    ):
         raise ResourceNotFoundError("Trip", trip_id)
 
-    # Soft delete the trip (cascade will handle days, stops, routes)
-    from datetime import datetime
-
-    trip.deleted_at = datetime.utcnow()
-    db.commit()
-
-    # Return confirmation payload
-    return {"message": "Trip deleted"}
+    # Return the fixed confirmation payload pre-encoded, skipping the JSON
+    # encoder for a body that never changes
+    return Response(content=_TRIP_DELETED_BODY, media_type="application/json")
 
 
 # Bulk Operations Endpoints
@@ -816,13 +1062,14 @@ async def bulk_delete_trips(
     - Remove test trips
     - Bulk cleanup operations
     """
+    current_user_id = current_user.id
     bulk_service = BulkOperationService(db)
 
     async def pre_delete_hook(trip: Trip):
         """Hook to handle trip-specific logic before deletion"""
         # Log the deletion for audit purposes
         logger.info(
-            f"Deleting trip {trip.id} ({trip.title}) for user {current_user.id}"
+            f"Deleting trip {trip.id} ({trip.title}) for user {current_user_id}"
         )
 
     async def post_delete_hook(trip: Trip):
@@ -833,7 +1080,7 @@ async def bulk_delete_trips(
     return await bulk_service.bulk_delete(
         model_class=Trip,
         ids=request.ids,
-        user_id=current_user.id,
+        user_id=current_user_id,
         force=request.force,
         pre_delete_hook=pre_delete_hook,
         post_delete_hook=post_delete_hook,
@@ -908,8 +1155,6 @@ async def bulk_update_trips(
 
         # Validate date format if being updated
         if "start_date" in update_data:
-            from datetime import datetime
-
             try:
                 datetime.strptime(str(update_data["start_date"]), "%Y-%m-%d")
             except ValueError:
@@ -929,10 +1174,13 @@ async def bulk_update_trips(
 
 
 @router.get("/{trip_id}/complete", response_model=TripCompleteResponse)
-async def get_trip_complete(
+def get_trip_complete(
     trip_id: str,
+    request: Request,
+    response: Response,
     include_place: bool = Query(
-        False, description="Include place information with stops"
+        False,
+        description="Accepted for compatibility; stops reference their place by place_id",
     ),
     include_route_info: bool = Query(False, description="Include route information"),
     status: Optional[str] = Query(None, description="Filter days by status"),
@@ -951,13 +1199,13 @@ async def get_trip_complete(
     - ✅ **Complete trip data**: Trip details, all days, and all stops
     - ✅ **Proper ordering**: Days by sequence (1, 2, 3...), stops by sequence within each day
     - ✅ **Summary statistics**: Total days, stops, duration, and breakdowns
-    - ✅ **Optional place details**: Include place information for each stop
     - ✅ **Route information**: Include route data if available
     - ✅ **Filtering**: Filter days by status
     - ✅ **Performance optimized**: Efficient queries with eager loading
+    - ✅ **Conditional requests**: Send the returned `ETag` as `If-None-Match` to get a 304 while the trip, its days and stops are unchanged
 
     **Query Parameters:**
-    - `include_place`: Include place details with stops (default: false)
+    - `include_place`: Accepted for compatibility; stops reference their place by `place_id` (default: false)
     - `include_route_info`: Include route information (default: false)
     - `status`: Filter days by status (active, completed, etc.)
     - `day_limit`: Limit number of days returned (1-50)
@@ -970,23 +1218,38 @@ async def get_trip_complete(
 
     **Authentication Required:** You must be the trip owner.
     """
-    # Get trip with user information
-    trip = (
-        db.query(Trip)
-        .options(joinedload(Trip.created_by_user))
-        .filter(Trip.id == trip_id, Trip.deleted_at.is_(None))
-        .first()
-    )
-
-    if not trip:
-        raise HTTPException(status_code=404, detail="Trip not found")
+    # Ownership is part of the WHERE clause, so another user's trip is never
+    # loaded; the creator is the already-loaded current_user
+    trip = _load_owned_trip(db, Trip.id == trip_id, current_user)
+    if trip is None:
+        # Nothing of ours matched: a cheap id-only probe tells 404 from 403
+        if (
+            db.query(Trip.id)
+            .filter(Trip.id == trip_id, Trip.deleted_at.is_(None))
+            .first()
+            is None
+        ):
+            raise HTTPException(status_code=404, detail="Trip not found")
 
-    # Check if user has access to this trip
-    if str(trip.created_by) != str(current_user.id):
         raise HTTPException(status_code=403, detail="Access denied")
 
-    # Build base query for days
-    days_query = db.query(Day).filter(Day.trip_id == trip_id, Day.deleted_at.is_(None))
+    # Revalidate before loading days and stops: an unchanged trip answers 304.
+    # no-cache (not max-age) so an edit is never served stale
+    etag = _trip_content_etag(db, trip)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=cache_headers)
+    response.headers.update(cache_headers)
+
+    # Build base query for days. Days and stops are serialized from their
+    # columns only; raiseload turns any relationship access that would slip
+    # in an N+1 into an error (add an explicit loader option instead)
+    days_query = (
+        db.query(Day)
+        .options(raiseload("*"))
+        .filter(Day.trip_id == trip_id, Day.deleted_at.is_(None))
+    )
 
     # Apply status filter if provided
     if status:
@@ -1007,76 +1270,70 @@ async def get_trip_complete(
     day_ids = [day.id for day in days] if days else []
     stops = []
     if day_ids:
-        stops_query = db.query(Stop).filter(
-            Stop.day_id.in_(day_ids), Stop.deleted_at.is_(None)
+        # Stops are serialized from their columns (place_id, not the place
+        # itself), so no place is loaded, whatever include_place says
+        stops = (
+            db.query(Stop)
+            .options(raiseload("*"))
+            .filter(Stop.day_id.in_(day_ids), Stop.deleted_at.is_(None))
+            .order_by(Stop.day_id, Stop.seq)
+            .all()
         )
 
-        # Include place information if requested
-        if include_place:
-            stops_query = stops_query.options(joinedload(Stop.place))
-
-        # Order stops by day_id and sequence
-        stops = stops_query.order_by(Stop.day_id, Stop.seq).all()
-
-    # Group stops by day_id
-    stops_by_day = {}
-    for stop in stops:
-        if stop.day_id not in stops_by_day:
-            stops_by_day[stop.day_id] = []
-        stops_by_day[stop.day_id].append(stop)
+    # Group stops by day_id; the query already ordered them by day_id
+    stops_by_day = {
+        day_id: list(day_stops)
+        for day_id, day_stops in groupby(stops, key=attrgetter("day_id"))
+    }
 
     # Build days with stops
     days_with_stops = []
-    total_stops = 0
-    status_breakdown = {}
-    stop_type_breakdown = {}
 
     for day in days:
         day_stops = stops_by_day.get(day.id, [])
-        total_stops += len(day_stops)
 
-        # Count day status
-        day_status_str = (
-            day.status.value if hasattr(day.status, "value") else str(day.status)
-        )
-        status_breakdown[day_status_str] = status_breakdown.get(day_status_str, 0) + 1
-
-        # Convert stops to schema and count stop types
-        stop_schemas = []
-        for stop in day_stops:
-            stop_dict = stop.__dict__.copy()
-            if include_place and stop.place:
-                stop_dict["place"] = stop.place
-            stop_schemas.append(StopSchema.model_validate(stop_dict))
-
-            # Count stop type
-            stop_type_str = (
-                stop.stop_type.value
-                if hasattr(stop.stop_type, "value")
-                else str(stop.stop_type)
-            )
-            stop_type_breakdown[stop_type_str] = (
-                stop_type_breakdown.get(stop_type_str, 0) + 1
+        # Build stops and days straight from the loaded column values:
+        # FastAPI validates the whole response against response_model
+        # anyway, so validating each one here would only repeat that pass
+        # (StopSchema has no place field, so nothing lazy-loads)
+        stop_schemas = [
+            StopSchema.model_construct(
+                **{key: getattr(stop, key) for key in _STOP_COLUMNS}
             )
+            for stop in day_stops
+        ]
 
         # Create day with all stops
-        day_dict = day.__dict__.copy()
-        day_dict["trip_start_date"] = trip.start_date
-        day_dict["stops"] = stop_schemas
-        day_dict["stops_count"] = len(day_stops)
-        day_dict["has_route"] = False  # TODO: Check for route versions when implemented
-
-        days_with_stops.append(DayWithAllStops.model_validate(day_dict))
+        days_with_stops.append(
+            DayWithAllStops.model_construct(
+                **{key: getattr(day, key) for key in _DAY_COLUMNS},
+                trip_start_date=trip.start_date,
+                stops=stop_schemas,
+                stops_count=len(day_stops),
+                has_route=False,  # TODO: Check for route versions when implemented
+            )
+        )
 
     # Calculate trip duration
     trip_duration_days = None
     if trip.start_date is not None and len(days) > 0:
         trip_duration_days = len(days)
 
+    # The days and stops are already loaded for the response, so count them
+    # in one C-level pass each rather than with extra GROUP BY queries
+    status_breakdown = {
+        getattr(day_status, "value", str(day_status)): count
+        for day_status, count in Counter(day.status for day in days).items()
+    }
+    stop_type_breakdown = {
+        getattr(stop_type, "value", str(stop_type)): count
+        for stop_type, count in Counter(stop.stop_type for stop in stops).items()
+    }
+
     # Create summary
-    summary = TripSummary(
+    summary = TripSummary.model_construct(
         total_days=len(days),
-        total_stops=total_stops,
+        total_stops=len(stops),
         trip_duration_days=trip_duration_days,
         status_breakdown=status_breakdown,
         stop_type_breakdown=stop_type_breakdown,
@@ -4,16 +4,18 @@ Places API Endpoints
 FastAPI endpoints for address and POI search with type-ahead suggestions.
 """
 
+import itertools
+import secrets
 import time
-import uuid
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Path, Header, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Path, Header, Depends, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+from fastapi.responses import ORJSONResponse
 import logging
 
 from .models import (
-    SuggestResponse, SearchResponse, PlaceDetails, HealthResponse, ErrorResponse,
-    SuggestRequest, SearchRequest, PlaceType, SortOrder
+    SuggestResponse, SearchResponse, PlaceDetails, HealthResponse,
+    SuggestRequest, SearchRequest, PlaceType, SortOrder, SortOrderLiteral
 )
 from .service import places_service
 from ....core.auth import get_current_user
@@ -21,41 +23,82 @@ from ....core.rate_limiting import RateLimiter
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/v1/places", tags=["places-typeahead"])
+router = APIRouter(
+    prefix="/v1/places", tags=["places-typeahead"], default_response_class=ORJSONResponse
+)
 
-# Rate limiter instances
+# Rate limiter instances, one per endpoint, keyed by client IP
 suggest_limiter = RateLimiter(max_requests=50, window_seconds=60)  # 50 requests per minute
 search_limiter = RateLimiter(max_requests=30, window_seconds=60)   # 30 requests per minute
 
 
+# Request IDs: a random per-process prefix plus a counter, so generating one
+# needs no CSPRNG draw (next() on itertools.count is atomic under the GIL)
+_REQUEST_ID_PREFIX = secrets.token_hex(3)
+_request_counter = itertools.count()
+
+
 def generate_request_id() -> str:
-    """Generate unique request ID for tracking"""
-    return f"req_{uuid.uuid4().hex[:12]}"
+    """Generate unique request ID for tracking (req_ + 18 hex chars)"""
+    # 48-bit counter field: never wraps in a process's lifetime
+    return f"req_{_REQUEST_ID_PREFIX}{next(_request_counter):012x}"
 
 
-def create_error_response(code: str, message: str, status_code: int = 400, retry_after_ms: Optional[int] = None) -> JSONResponse:
-    """Create standardized error response"""
-    request_id = generate_request_id()
-    error_response = ErrorResponse(
-        error={
+def create_error_response(code: str, message: str, status_code: int = 400, retry_after_ms: Optional[int] = None) -> ORJSONResponse:
+    """Create standardized error response (shaped like ErrorResponse)"""
+    # Fixed shape built directly; no model to validate and dump per error
+    content = {
+        "error": {
             "code": code,
             "message": message,
             "retry_after_ms": retry_after_ms,
-            "request_id": request_id
+            "request_id": generate_request_id()
         }
-    )
+    }
     
     headers = {}
     if retry_after_ms:
         headers["Retry-After"] = str(retry_after_ms // 1000)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
-        content=error_response.dict(),
+        content=content,
         headers=headers
     )
 
 
+class PlacesRateLimitMiddleware:
+    """Rate-limit /suggest and /search per client IP in front of the app.
+
+    Plain ASGI, so a rejected request gets its 429 before any auth, query
+    validation or handler work runs.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path.endswith("/v1/places/suggest"):
+                limiter, message = suggest_limiter, "Too many suggestion requests"
+            elif path.endswith("/v1/places/search"):
+                limiter, message = search_limiter, "Too many search requests"
+            else:
+                limiter = None
+
+            if limiter is not None:
+                client_ip = scope["client"][0] if scope.get("client") else ""
+                if not limiter.allow_request(client_ip):
+                    response = create_error_response(
+                        "RATE_LIMIT", message, 429, retry_after_ms=60000
+                    )
+                    await response(scope, receive, send)
+                    return
+
+        await self.app(scope, receive, send)
+
+
 @router.get("/suggest",
     response_model=SuggestResponse,
     summary="Type-ahead Suggestions",
@@ -63,7 +106,7 @@ def create_error_response(code: str, message: str, status_code: int = 400, retry
     response_description="List of place suggestions with highlighted matching text"
 )
 async def get_suggestions(
-    request: Request,
+    background_tasks: BackgroundTasks,
     q: str = Query(..., min_length=1, max_length=256, description="Search query (minimum 1 character)", examples={"default": {"value": "montef"}}),
     session_token: str = Query(..., description="Session token for grouping requests", examples={"default": {"value": "st_abc123"}}),
     lat: Optional[float] = Query(None, ge=-90, le=90, description="User latitude for proximity bias", examples={"default": {"value": 32.07}}),
@@ -111,16 +154,6 @@ async def get_suggestions(
     request_id = generate_request_id()
     
     try:
-        # Rate limiting
-        client_ip = request.client.host
-        if not suggest_limiter.allow_request(f"suggest:{client_ip}"):
-            return create_error_response(
-                "RATE_LIMIT",
-                "Too many suggestion requests",
-                429,
-                retry_after_ms=60000
-            )
-        
         # Validate coordinate pair
         if (lat is None) != (lng is None):
             return create_error_response(
@@ -147,11 +180,21 @@ async def get_suggestions(
         
         # Log performance
         duration_ms = (time.time() - start_time) * 1000
-        logger.info(f"Suggestions request {request_id} completed in {duration_ms:.1f}ms")
+        # Logged after the response is sent; %-args are only formatted if the
+        # record is emitted
+        background_tasks.add_task(
+            logger.info, "Suggestions request %s completed in %.1fms", request_id, duration_ms
+        )
         
-        return SuggestResponse(
-            session_token=session_token,
-            suggestions=suggestions
+        # The suggestions were validated when the service built them, so
+        # serialize once in pydantic-core and skip FastAPI's
+        # dump/re-validate/encode pass over response_model
+        return Response(
+            content=SuggestResponse.model_construct(
+                session_token=session_token,
+                suggestions=suggestions
+            ).model_dump_json(),
+            media_type="application/json"
         )
         
     except ValueError as e:
@@ -173,7 +216,7 @@ async def get_suggestions(
     response_description="Detailed search results with complete place information"
 )
 async def search_places(
-    request: Request,
+    background_tasks: BackgroundTasks,
     q: str = Query(..., min_length=1, max_length=256, description="Search query", examples={"default": {"value": "hotel montefiore"}}),
     lat: Optional[float] = Query(None, ge=-90, le=90, description="User latitude for proximity bias", examples={"default": {"value": 32.07}}),
     lng: Optional[float] = Query(None, ge=-180, le=180, description="User longitude for proximity bias", examples={"default": {"value": 34.78}}),
@@ -186,7 +229,7 @@ async def search_places(
     page_token: Optional[str] = Query(None, description="Pagination token for next page", examples={"default": {"value": "page_20_1234567890"}}),
     offset: Optional[int] = Query(None, ge=0, description="Result offset for pagination", examples={"default": {"value": 0}}),
     open_now: Optional[bool] = Query(None, description="Filter for currently open POIs", examples={"default": {"value": True}}),
-    sort: Optional[SortOrder] = Query(SortOrder.RELEVANCE, description="Sort order", examples={"default": {"value": "relevance"}}),
+    sort: Optional[SortOrderLiteral] = Query(SortOrder.RELEVANCE.value, description="Sort order", examples={"default": {"value": "relevance"}}),
     current_user = Depends(get_current_user)
 ):
     """
@@ -231,16 +274,6 @@ async def search_places(
     request_id = generate_request_id()
     
     try:
-        # Rate limiting
-        client_ip = request.client.host
-        if not search_limiter.allow_request(f"search:{client_ip}"):
-            return create_error_response(
-                "RATE_LIMIT",
-                "Too many search requests",
-                429,
-                retry_after_ms=60000
-            )
-        
         # Validate coordinate pair
         if (lat is None) != (lng is None):
             return create_error_response(
@@ -267,16 +300,21 @@ async def search_places(
         )
         
         # Perform search
-        results, next_page_token = await places_service.search_places(search_request)
+        results, next_page_token, total_count = await places_service.search_places(search_request)
         
         # Log performance
         duration_ms = (time.time() - start_time) * 1000
-        logger.info(f"Search request {request_id} completed in {duration_ms:.1f}ms")
+        background_tasks.add_task(
+            logger.info, "Search request %s completed in %.1fms", request_id, duration_ms
+        )
         
-        return SearchResponse(
-            results=results,
-            page_token=next_page_token,
-            total_count=len(results)  # Simplified for demo
+        return Response(
+            content=SearchResponse.model_construct(
+                results=results,
+                page_token=next_page_token,
+                total_count=total_count
+            ).model_dump_json(),
+            media_type="application/json"
         )
         
     except ValueError as e:
@@ -298,6 +336,7 @@ async def search_places(
     response_description="Complete place information including contact details, hours, and ratings"
 )
 async def get_place_details(
+    background_tasks: BackgroundTasks,
     place_id: str = Path(..., description="Unique place identifier", examples={"default": {"value": "poi_hotel_montefiore"}}),
     current_user = Depends(get_current_user)
 ):
@@ -354,9 +393,17 @@ async def get_place_details(
         
         # Log performance
         duration_ms = (time.time() - start_time) * 1000
-        logger.info(f"Details request {request_id} for {place_id} completed in {duration_ms:.1f}ms")
+        background_tasks.add_task(
+            logger.info, "Details request %s for %s completed in %.1fms", request_id, place_id, duration_ms
+        )
         
-        return details
+        # Serialized once in pydantic-core, as for suggest/search; going
+        # through response_model would re-validate every field, including
+        # a recursive walk of the free-form hours dict
+        return Response(
+            content=details.model_dump_json(),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Error in place details endpoint: {e}")
@@ -400,11 +447,13 @@ async def health_check():
     try:
         uptime = places_service.get_uptime()
         
-        return HealthResponse(
-            status="ok",
-            uptime_s=uptime,
-            version="1.0.0"
-        )
+        # Returned as a Response, so no HealthResponse is built or validated
+        # per probe; response_model still documents the shape
+        return ORJSONResponse({
+            "status": "ok",
+            "uptime_s": uptime,
+            "version": "1.0.0"
+        })
         
     except Exception as e:
         logger.error(f"Error in health check: {e}")
@@ -4,11 +4,31 @@ Places API Models
 Data models for address and POI search with type-ahead suggestions.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+import re
+from typing import List, Literal, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator, model_validator
 from enum import Enum
 
 
+_COORD = r'\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+))\s*'
+# minLon,minLat,maxLon,maxLat matched and captured in one pass
+_BBOX_RE = re.compile(f'^{_COORD},{_COORD},{_COORD},{_COORD}$')
+
+# ISO-3166-1 alpha-2 codes (all 249 officially assigned)
+_ISO_3166_ALPHA2 = frozenset('''
+    AD AE AF AG AI AL AM AO AQ AR AS AT AU AW AX AZ BA BB BD BE BF BG BH BI BJ
+    BL BM BN BO BQ BR BS BT BV BW BY BZ CA CC CD CF CG CH CI CK CL CM CN CO CR
+    CU CV CW CX CY CZ DE DJ DK DM DO DZ EC EE EG EH ER ES ET FI FJ FK FM FO FR
+    GA GB GD GE GF GG GH GI GL GM GN GP GQ GR GS GT GU GW GY HK HM HN HR HT HU
+    ID IE IL IM IN IO IQ IR IS IT JE JM JO JP KE KG KH KI KM KN KP KR KW KY KZ
+    LA LB LC LI LK LR LS LT LU LV LY MA MC MD ME MF MG MH MK ML MM MN MO MP MQ
+    MR MS MT MU MV MW MX MY MZ NA NC NE NF NG NI NL NO NP NR NU NZ OM PA PE PF
+    PG PH PK PL PM PN PR PS PT PW PY QA RE RO RS RU RW SA SB SC SD SE SG SH SI
+    SJ SK SL SM SN SO SR SS ST SV SX SY SZ TC TD TF TG TH TJ TK TL TM TN TO TR
+    TT TV TW TZ UA UG UM US UY UZ VA VC VE VG VI VN VU WF WS YE YT ZA ZM ZW
+'''.split())
+
+
 class GeometryType(str, Enum):
     """Precision level of coordinates"""
     ROOFTOP = "rooftop"
@@ -17,6 +37,12 @@ class GeometryType(str, Enum):
     INTERPOLATED = "interpolated"
 
 
+# Model fields use these Literal mirrors of the enums above: pydantic-core
+# checks a plain string against them without creating an Enum member per
+# value. Keep each one in step with its enum.
+GeometryTypeLiteral = Literal["rooftop", "route", "centroid", "interpolated"]
+
+
 class PlaceType(str, Enum):
     """Place type categories"""
     ADDRESS = "address"
@@ -28,6 +54,11 @@ class PlaceType(str, Enum):
     BUSINESS = "business"
 
 
+PlaceTypeLiteral = Literal[
+    "address", "poi", "lodging", "restaurant", "museum", "attraction", "business"
+]
+
+
 class SortOrder(str, Enum):
     """Search result sorting options"""
     RELEVANCE = "relevance"
@@ -36,12 +67,25 @@ class SortOrder(str, Enum):
     POPULARITY = "popularity"
 
 
+SortOrderLiteral = Literal["relevance", "distance", "rating", "popularity"]
+
+
 class Coordinates(BaseModel):
     """Geographic coordinates"""
     lat: float = Field(..., ge=-90, le=90, description="Latitude in WGS-84 decimal degrees")
     lng: float = Field(..., ge=-180, le=180, description="Longitude in WGS-84 decimal degrees")
 
 
+def _with_trusted_center(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a plain ``center`` dict into Coordinates for model_construct"""
+    center = data["center"]
+    if isinstance(center, dict):
+        data = {**data, "center": Coordinates.model_construct(
+            lat=float(center["lat"]), lng=float(center["lng"])
+        )}
+    return data
+
+
 class BoundingBox(BaseModel):
     """Geographic bounding box"""
     minLat: float = Field(..., ge=-90, le=90)
@@ -49,17 +93,13 @@ class BoundingBox(BaseModel):
     maxLat: float = Field(..., ge=-90, le=90)
     maxLng: float = Field(..., ge=-180, le=180)
 
-    @validator('maxLat')
-    def validate_lat_order(cls, v, values):
-        if 'minLat' in values and v <= values['minLat']:
+    @model_validator(mode='after')
+    def validate_order(self):
+        if self.maxLat <= self.minLat:
             raise ValueError('maxLat must be greater than minLat')
-        return v
-
-    @validator('maxLng')
-    def validate_lng_order(cls, v, values):
-        if 'minLng' in values and v <= values['minLng']:
+        if self.maxLng <= self.minLng:
             raise ValueError('maxLng must be greater than minLng')
-        return v
+        return self
 
 
 class PlaceMetadata(BaseModel):
@@ -78,26 +118,46 @@ class PlaceSuggestion(BaseModel):
     name: str = Field(..., description="Place name")
     highlighted: str = Field(..., description="Name with highlighted matching text")
     formatted_address: str = Field(..., description="Human-readable address")
-    types: List[PlaceType] = Field(default_factory=list, description="Place type categories")
+    types: List[PlaceTypeLiteral] = Field(default_factory=list, description="Place type categories")
     center: Coordinates = Field(..., description="Geographic center point")
     distance_m: Optional[int] = Field(None, description="Distance from query point in meters")
     confidence: float = Field(..., ge=0, le=1, description="Confidence score 0-1")
     source: str = Field(default="internal", description="Data source identifier")
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "PlaceSuggestion":
+        """Build a suggestion from internal, already-valid data without validation.
+
+        model_construct does not recurse, so a plain ``center`` dict is
+        turned into Coordinates here. Never use this for provider or
+        client payloads.
+        """
+        return cls.model_construct(**_with_trusted_center(data))
+
 
 class PlaceSearchResult(BaseModel):
     """Full search result with complete details"""
     id: str = Field(..., description="Unique place identifier")
     name: str = Field(..., description="Place name")
     formatted_address: str = Field(..., description="Human-readable address")
-    types: List[PlaceType] = Field(default_factory=list, description="Place type categories")
+    types: List[PlaceTypeLiteral] = Field(default_factory=list, description="Place type categories")
     center: Coordinates = Field(..., description="Geographic center point")
     bbox: Optional[BoundingBox] = Field(None, description="Bounding box if available")
     categories: List[str] = Field(default_factory=list, description="Detailed categories")
     score: float = Field(..., ge=0, le=1, description="Relevance score 0-1")
     timezone: Optional[str] = Field(None, description="IANA timezone identifier")
     metadata: Optional[PlaceMetadata] = Field(None, description="Additional metadata")
-    geometry_type: Optional[GeometryType] = Field(None, description="Coordinate precision")
+    geometry_type: Optional[GeometryTypeLiteral] = Field(None, description="Coordinate precision")
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]):
+        """Build a result (or PlaceDetails) from internal data without validation.
+
+        Same contract as PlaceSuggestion.from_trusted: nested models other
+        than ``center`` must already be built, and provider or client
+        payloads must never come through here.
+        """
+        return cls.model_construct(**_with_trusted_center(data))
 
 
 class PlaceDetails(PlaceSearchResult):
@@ -128,24 +188,29 @@ class SuggestRequest(BaseModel):
     lang: Optional[str] = Field("en", description="BCP-47 language code")
     limit: Optional[int] = Field(8, ge=1, le=20, description="Maximum results")
 
-    @validator('bbox')
+    @field_validator('bbox')
+    @classmethod
     def validate_bbox(cls, v):
         if v is None:
             return v
-        try:
-            coords = [float(x.strip()) for x in v.split(',')]
-            if len(coords) != 4:
-                raise ValueError('bbox must have exactly 4 coordinates')
-            minLng, minLat, maxLng, maxLat = coords
-            if not (-180 <= minLng <= 180 and -180 <= maxLng <= 180):
-                raise ValueError('longitude must be between -180 and 180')
-            if not (-90 <= minLat <= 90 and -90 <= maxLat <= 90):
-                raise ValueError('latitude must be between -90 and 90')
-            if minLng >= maxLng or minLat >= maxLat:
-                raise ValueError('bbox coordinates must be in correct order')
+        m = _BBOX_RE.match(v)
+        if m is None:
+            raise ValueError('Invalid bbox format: expected minLon,minLat,maxLon,maxLat')
+        minLng, minLat, maxLng, maxLat = map(float, m.groups())
+        if not (-180.0 <= minLng < maxLng <= 180.0 and -90.0 <= minLat < maxLat <= 90.0):
+            raise ValueError('Invalid bbox format: coordinates out of range or in wrong order')
+        return v
+
+    @field_validator('countries')
+    @classmethod
+    def validate_countries(cls, v):
+        if v is None:
             return v
-        except (ValueError, TypeError) as e:
-            raise ValueError(f'Invalid bbox format: {e}')
+        codes = [c for c in (part.strip().upper() for part in v.split(',')) if c]
+        unknown = [c for c in codes if c not in _ISO_3166_ALPHA2]
+        if unknown:
+            raise ValueError(f"Unknown country codes: {', '.join(unknown)}")
+        return ','.join(codes)
 
 
 class SearchRequest(SuggestRequest):
@@ -153,7 +218,7 @@ class SearchRequest(SuggestRequest):
     page_token: Optional[str] = Field(None, description="Pagination token")
     offset: Optional[int] = Field(None, ge=0, description="Result offset")
     open_now: Optional[bool] = Field(None, description="Filter for currently open POIs")
-    sort: Optional[SortOrder] = Field(SortOrder.RELEVANCE, description="Sort order")
+    sort: Optional[SortOrderLiteral] = Field(SortOrder.RELEVANCE.value, description="Sort order")
 
 
 # Response Models
@@ -14,14 +14,23 @@ from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 
+import numpy as np
+
 from .models import (
-    PlaceSuggestion, PlaceSearchResult, PlaceDetails, Coordinates, BoundingBox,
-    PlaceType, GeometryType, PlaceMetadata, SuggestRequest, SearchRequest
+    PlaceSuggestion, PlaceSearchResult, PlaceDetails, BoundingBox,
+    GeometryType, PlaceMetadata, SuggestRequest, SearchRequest
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _split_csv(value: Optional[str]) -> Tuple[str, ...]:
+    """Split a comma-separated filter into its stripped, non-empty parts"""
+    if not value:
+        return ()
+    return tuple(part for part in (p.strip() for p in value.split(",")) if part)
+
+
 class PlacesService:
     """Service for address and POI search operations"""
     
@@ -32,6 +41,12 @@ class PlacesService:
         
         # Mock data for demonstration
         self._mock_places = self._initialize_mock_data()
+
+        # Place coordinates as radian arrays so distances from the user to
+        # every place come out of one vectorized pass per request
+        self._place_lat_rad = np.radians([p["center"]["lat"] for p in self._mock_places])
+        self._place_lng_rad = np.radians([p["center"]["lng"] for p in self._mock_places])
+        self._place_cos_lat = np.cos(self._place_lat_rad)
     
     def _initialize_mock_data(self) -> List[Dict[str, Any]]:
         """Initialize mock place data for demonstration"""
@@ -40,7 +55,7 @@ class PlacesService:
                 "id": "poi_tel_aviv_museum",
                 "name": "Tel Aviv Museum of Art",
                 "formatted_address": "27 Shaul Hamelech Blvd, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.MUSEUM, PlaceType.POI],
+                "types": ["museum", "poi"],
                 "center": {"lat": 32.0773, "lng": 34.7863},
                 "categories": ["museum", "art", "culture"],
                 "country": "IL",
@@ -54,7 +69,7 @@ class PlacesService:
                 "id": "poi_hotel_montefiore",
                 "name": "Hotel Montefiore",
                 "formatted_address": "36 Montefiore St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.LODGING, PlaceType.POI],
+                "types": ["lodging", "poi"],
                 "center": {"lat": 32.0643, "lng": 34.7748},
                 "categories": ["hotel", "lodging", "boutique"],
                 "country": "IL",
@@ -68,7 +83,7 @@ class PlacesService:
                 "id": "poi_carmel_market",
                 "name": "Carmel Market",
                 "formatted_address": "HaCarmel St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ATTRACTION, PlaceType.POI],
+                "types": ["attraction", "poi"],
                 "center": {"lat": 32.0692, "lng": 34.7751},
                 "categories": ["market", "food", "shopping"],
                 "country": "IL",
@@ -81,7 +96,7 @@ class PlacesService:
                 "id": "addr_rothschild_1",
                 "name": "1 Rothschild Boulevard",
                 "formatted_address": "1 Rothschild Blvd, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0644, "lng": 34.7719},
                 "categories": ["address"],
                 "country": "IL",
@@ -91,7 +106,7 @@ class PlacesService:
                 "id": "poi_restaurant_orna_ella",
                 "name": "Orna and Ella",
                 "formatted_address": "33 Sheinkin St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.RESTAURANT, PlaceType.POI],
+                "types": ["restaurant", "poi"],
                 "center": {"lat": 32.0656, "lng": 34.7739},
                 "categories": ["restaurant", "israeli", "breakfast"],
                 "country": "IL",
@@ -104,7 +119,7 @@ class PlacesService:
                 "id": "addr_london_downing",
                 "name": "10 Downing Street",
                 "formatted_address": "10 Downing St, London SW1A 2AA, UK",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 51.5034, "lng": -0.1276},
                 "categories": ["address", "government"],
                 "country": "GB",
@@ -115,7 +130,7 @@ class PlacesService:
                 "id": "poi_british_museum",
                 "name": "British Museum",
                 "formatted_address": "Great Russell St, London WC1B 3DG, UK",
-                "types": [PlaceType.MUSEUM, PlaceType.POI],
+                "types": ["museum", "poi"],
                 "center": {"lat": 51.5194, "lng": -0.1270},
                 "categories": ["museum", "history", "culture"],
                 "country": "GB",
@@ -133,7 +148,7 @@ class PlacesService:
                 "name_local": "מוזיאון תל אביב לאמנות",
                 "formatted_address": "שדרות שאול המלך 27, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "27 Shaul Hamelech Blvd, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.MUSEUM, PlaceType.POI],
+                "types": ["museum", "poi"],
                 "center": {"lat": 32.0773, "lng": 34.7863},
                 "categories": ["museum", "art", "culture", "מוזיאון", "אמנות", "תרבות"],
                 "country": "IL",
@@ -151,7 +166,7 @@ class PlacesService:
                 "name_local": "שוק הכרמל",
                 "formatted_address": "רחוב הכרמל, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "HaCarmel St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ATTRACTION, PlaceType.POI],
+                "types": ["attraction", "poi"],
                 "center": {"lat": 32.0692, "lng": 34.7751},
                 "categories": ["market", "food", "shopping", "שוק", "אוכל", "קניות"],
                 "country": "IL",
@@ -168,7 +183,7 @@ class PlacesService:
                 "name_local": "דיזנגוף סנטר",
                 "formatted_address": "רחוב דיזנגוף 50, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "50 Dizengoff St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ATTRACTION, PlaceType.POI],
+                "types": ["attraction", "poi"],
                 "center": {"lat": 32.0740, "lng": 34.7749},
                 "categories": ["shopping", "mall", "center", "קניות", "קניון", "מרכז"],
                 "country": "IL",
@@ -186,7 +201,7 @@ class PlacesService:
                 "name_local": "שדרות רוטשילד 1",
                 "formatted_address": "שדרות רוטשילד 1, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "1 Rothschild Blvd, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0644, "lng": 34.7719},
                 "categories": ["address", "כתובת"],
                 "country": "IL",
@@ -200,7 +215,7 @@ class PlacesService:
                 "name_local": "מזנון",
                 "formatted_address": "רחוב קינג ג'ורג' 23, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "23 King George St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.RESTAURANT, PlaceType.POI],
+                "types": ["restaurant", "poi"],
                 "center": {"lat": 32.0719, "lng": 34.7758},
                 "categories": ["restaurant", "israeli", "pita", "מסעדה", "ישראלי", "פיתה"],
                 "country": "IL",
@@ -218,7 +233,7 @@ class PlacesService:
                 "name_local": "רחוב ירקון",
                 "formatted_address": "רחוב ירקון, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "Yarkon St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0851, "lng": 34.7692},
                 "categories": ["address", "street", "כתובת", "רחוב"],
                 "country": "IL",
@@ -232,7 +247,7 @@ class PlacesService:
                 "name_local": "רחוב יגאל אלון",
                 "formatted_address": "רחוב יגאל אלון, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "Yigal Alon St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0567, "lng": 34.7925},
                 "categories": ["address", "street", "כתובת", "רחוב"],
                 "country": "IL",
@@ -246,7 +261,7 @@ class PlacesService:
                 "name_local": "רחוב בן יהודה",
                 "formatted_address": "רחוב בן יהודה, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "Ben Yehuda St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0808, "lng": 34.7709},
                 "categories": ["address", "street", "כתובת", "רחוב"],
                 "country": "IL",
@@ -260,7 +275,7 @@ class PlacesService:
                 "name_local": "רחוב אלנבי",
                 "formatted_address": "רחוב אלנבי, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "Allenby St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0668, "lng": 34.7701},
                 "categories": ["address", "street", "כתובת", "רחוב"],
                 "country": "IL",
@@ -274,7 +289,7 @@ class PlacesService:
                 "name_local": "רחוב שינקין",
                 "formatted_address": "רחוב שינקין, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "Sheinkin St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0656, "lng": 34.7739},
                 "categories": ["address", "street", "כתובת", "רחוב"],
                 "country": "IL",
@@ -288,7 +303,7 @@ class PlacesService:
                 "name_local": "רחוב קינג ג'ורג'",
                 "formatted_address": "רחוב קינג ג'ורג', תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "King George St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0719, "lng": 34.7758},
                 "categories": ["address", "street", "כתובת", "רחוב"],
                 "country": "IL",
@@ -302,7 +317,7 @@ class PlacesService:
                 "name_local": "פארק הירקון",
                 "formatted_address": "פארק הירקון, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "Hayarkon Park, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ATTRACTION, PlaceType.POI],
+                "types": ["attraction", "poi"],
                 "center": {"lat": 32.1067, "lng": 34.7925},
                 "categories": ["park", "nature", "recreation", "פארק", "טבע", "נופש"],
                 "country": "IL",
@@ -318,7 +333,7 @@ class PlacesService:
                 "name_local": "מגדלי עזריאלי",
                 "formatted_address": "מגדלי עזריאלי, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "Azrieli Towers, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ATTRACTION, PlaceType.POI],
+                "types": ["attraction", "poi"],
                 "center": {"lat": 32.0742, "lng": 34.7915},
                 "categories": ["building", "tower", "shopping", "בניין", "מגדל", "קניות"],
                 "country": "IL",
@@ -336,7 +351,7 @@ class PlacesService:
                 "name_local": "יפו העתיקה",
                 "formatted_address": "יפו העתיקה, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "Old Jaffa, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ATTRACTION, PlaceType.POI],
+                "types": ["attraction", "poi"],
                 "center": {"lat": 32.0546, "lng": 34.7506},
                 "categories": ["historic", "culture", "tourism", "היסטורי", "תרבות", "תיירות"],
                 "country": "IL",
@@ -353,7 +368,7 @@ class PlacesService:
                 "name_local": "ירקון 1",
                 "formatted_address": "ירקון 1, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "1 Yarkon St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0851, "lng": 34.7692},
                 "categories": ["address", "כתובת"],
                 "country": "IL",
@@ -367,7 +382,7 @@ class PlacesService:
                 "name_local": "בן יהודה 123",
                 "formatted_address": "בן יהודה 123, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "123 Ben Yehuda St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0808, "lng": 34.7709},
                 "categories": ["address", "כתובת"],
                 "country": "IL",
@@ -381,7 +396,7 @@ class PlacesService:
                 "name_local": "אלנבי 45",
                 "formatted_address": "אלנבי 45, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "45 Allenby St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0668, "lng": 34.7701},
                 "categories": ["address", "כתובת"],
                 "country": "IL",
@@ -395,7 +410,7 @@ class PlacesService:
                 "name_local": "שינקין 67",
                 "formatted_address": "שינקין 67, תל אביב-יפו, ישראל",
                 "formatted_address_ascii": "67 Sheinkin St, Tel Aviv-Yafo, Israel",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 32.0656, "lng": 34.7739},
                 "categories": ["address", "כתובת"],
                 "country": "IL",
@@ -407,7 +422,7 @@ class PlacesService:
                 "id": "addr_oxford_street_100",
                 "name": "100 Oxford Street",
                 "formatted_address": "100 Oxford St, London W1D 1LL, UK",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 51.5155, "lng": -0.1426},
                 "categories": ["address"],
                 "country": "GB",
@@ -419,7 +434,7 @@ class PlacesService:
                 "id": "addr_broadway_1234",
                 "name": "1234 Broadway",
                 "formatted_address": "1234 Broadway, New York, NY 10001, USA",
-                "types": [PlaceType.ADDRESS],
+                "types": ["address"],
                 "center": {"lat": 40.7505, "lng": -73.9934},
                 "categories": ["address"],
                 "country": "US",
@@ -443,11 +458,13 @@ class PlacesService:
             if request.lat is not None and request.lng is not None:
                 user_location = (request.lat, request.lng)
             
-            for place_data in self._mock_places:
-                score = self._calculate_relevance_score(query, place_data, user_location, request)
+            filters = self._request_filters(request)
+            distances = self._distances_from(user_location)
+            for place_data, distance_m in zip(self._mock_places, distances, strict=True):
+                score = self._calculate_relevance_score(query, place_data, distance_m, *filters)
                 
                 if score > 0.1:  # Minimum relevance threshold
-                    suggestion = self._create_suggestion(place_data, query, score, user_location)
+                    suggestion = self._create_suggestion(place_data, query, score, distance_m)
                     suggestions.append(suggestion)
             
             # Sort by score and limit results
@@ -468,8 +485,12 @@ class PlacesService:
             logger.error(f"Error in get_suggestions: {e}")
             raise
     
-    async def search_places(self, request: SearchRequest) -> Tuple[List[PlaceSearchResult], Optional[str]]:
-        """Search for places with full details"""
+    async def search_places(self, request: SearchRequest) -> Tuple[List[PlaceSearchResult], Optional[str], int]:
+        """Search for places with full details.
+
+        Returns the requested page, the next page token and the total number
+        of matches across all pages.
+        """
         start_time = time.time()
         
         try:
@@ -480,8 +501,10 @@ class PlacesService:
             
             # Filter and score places
             results = []
-            for place_data in self._mock_places:
-                score = self._calculate_relevance_score(query, place_data, user_location, request)
+            filters = self._request_filters(request)
+            distances = self._distances_from(user_location)
+            for place_data, distance_m in zip(self._mock_places, distances, strict=True):
+                score = self._calculate_relevance_score(query, place_data, distance_m, *filters)
                 
                 if score > 0.05:  # Lower threshold for search
                     result = self._create_search_result(place_data, score, user_location)
@@ -507,7 +530,7 @@ class PlacesService:
                 page_token = f"page_{offset + limit}_{int(time.time())}"
             
             logger.info(f"Search query completed in {(time.time() - start_time)*1000:.1f}ms")
-            return results, page_token
+            return results, page_token, total_results
             
         except Exception as e:
             logger.error(f"Error in search_places: {e}")
@@ -526,32 +549,32 @@ class PlacesService:
             if not place_data:
                 return None
             
-            # Create detailed response
-            details = PlaceDetails(
-                id=place_data["id"],
-                name=place_data["name"],
-                formatted_address=place_data["formatted_address"],
-                types=place_data["types"],
-                center=Coordinates(**place_data["center"]),
-                bbox=self._calculate_bbox(place_data["center"]),
-                categories=place_data.get("categories", []),
-                score=1.0,  # Perfect match for direct lookup
-                timezone=place_data.get("timezone"),
-                metadata=PlaceMetadata(
+            # Create detailed response from internal data
+            details = PlaceDetails.from_trusted({
+                "id": place_data["id"],
+                "name": place_data["name"],
+                "formatted_address": place_data["formatted_address"],
+                "types": place_data["types"],
+                "center": place_data["center"],
+                "bbox": self._calculate_bbox(place_data["center"]),
+                "categories": place_data.get("categories", []),
+                "score": 1.0,  # Perfect match for direct lookup
+                "timezone": place_data.get("timezone"),
+                "metadata": PlaceMetadata.model_construct(
                     country=place_data.get("country"),
                     postcode=place_data.get("postcode")
                 ),
-                geometry_type=GeometryType.ROOFTOP,
-                phone=place_data.get("phone"),
-                website=place_data.get("website"),
-                hours=place_data.get("hours"),
-                rating=place_data.get("rating"),
-                popularity=place_data.get("popularity"),
-                aliases=[],
-                source_refs={"internal": place_data["id"]},
-                name_local=place_data.get("name_local"),
-                name_ascii=place_data.get("name_ascii")
-            )
+                "geometry_type": GeometryType.ROOFTOP.value,
+                "phone": place_data.get("phone"),
+                "website": place_data.get("website"),
+                "hours": place_data.get("hours"),
+                "rating": place_data.get("rating"),
+                "popularity": place_data.get("popularity"),
+                "aliases": [],
+                "source_refs": {"internal": place_data["id"]},
+                "name_local": place_data.get("name_local"),
+                "name_ascii": place_data.get("name_ascii")
+            })
             
             return details
             
@@ -668,12 +691,20 @@ class PlacesService:
 
         return min(score, 1.0)
 
+    def _request_filters(self, request: SuggestRequest) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Parse the category and country filters once per request, not per place"""
+        return (
+            tuple(self._normalize_text(c) for c in _split_csv(request.categories)),
+            tuple(c.upper() for c in _split_csv(request.countries)),
+        )
+
     def _calculate_relevance_score(
         self,
         query: str,
         place_data: Dict[str, Any],
-        user_location: Optional[Tuple[float, float]],
-        request: Any
+        distance_m: Optional[float],
+        requested_categories: Tuple[str, ...] = (),
+        requested_countries: Tuple[str, ...] = ()
     ) -> float:
         """Calculate relevance score for a place given a query"""
         score = 0.0
@@ -713,8 +744,7 @@ class PlacesService:
         score += address_component_score * 0.4
 
         # Category matching - support Hebrew and English categories
-        if hasattr(request, 'categories') and request.categories:
-            requested_categories = [self._normalize_text(c.strip()) for c in request.categories.split(',')]
+        if requested_categories:
             place_categories = [self._normalize_text(c) for c in place_data.get("categories", [])]
 
             category_match = False
@@ -737,25 +767,19 @@ class PlacesService:
                 score += 0.15 * cat_score
         
         # Country filtering
-        if hasattr(request, 'countries') and request.countries:
-            requested_countries = [c.strip().upper() for c in request.countries.split(',')]
+        if requested_countries:
             place_country = place_data.get("country", "").upper()
             if place_country not in requested_countries:
                 score *= 0.1  # Heavily penalize wrong country
         
         # Proximity boost
-        if user_location and score > 0:
-            distance = self._calculate_distance(
-                user_location[0], user_location[1],
-                place_data["center"]["lat"], place_data["center"]["lng"]
-            )
-            
+        if distance_m is not None and score > 0:
             # Boost nearby places
-            if distance < 1000:  # Within 1km
+            if distance_m < 1000:  # Within 1km
                 score *= 1.2
-            elif distance < 5000:  # Within 5km
+            elif distance_m < 5000:  # Within 5km
                 score *= 1.1
-            elif distance > 50000:  # More than 50km
+            elif distance_m > 50000:  # More than 50km
                 score *= 0.8
         
         # Popularity boost
@@ -769,31 +793,24 @@ class PlacesService:
         place_data: Dict[str, Any], 
         query: str, 
         score: float,
-        user_location: Optional[Tuple[float, float]]
+        distance_m: Optional[float]
     ) -> PlaceSuggestion:
         """Create a suggestion from place data"""
         # Highlight matching text
         highlighted = self._highlight_text(place_data["name"], query)
         
-        # Calculate distance
-        distance_m = None
-        if user_location:
-            distance_m = int(self._calculate_distance(
-                user_location[0], user_location[1],
-                place_data["center"]["lat"], place_data["center"]["lng"]
-            ))
-        
-        return PlaceSuggestion(
-            id=place_data["id"],
-            name=place_data["name"],
-            highlighted=highlighted,
-            formatted_address=place_data["formatted_address"],
-            types=place_data["types"],
-            center=Coordinates(**place_data["center"]),
-            distance_m=distance_m,
-            confidence=score,
-            source="internal"
-        )
+        # Internal place data and a score clamped to [0, 1]: skip validation
+        return PlaceSuggestion.from_trusted({
+            "id": place_data["id"],
+            "name": place_data["name"],
+            "highlighted": highlighted,
+            "formatted_address": place_data["formatted_address"],
+            "types": place_data["types"],
+            "center": place_data["center"],
+            "distance_m": int(distance_m) if distance_m is not None else None,
+            "confidence": score,
+            "source": "internal"
+        })
     
     def _create_search_result(
         self, 
@@ -802,22 +819,23 @@ class PlacesService:
         user_location: Optional[Tuple[float, float]]
     ) -> PlaceSearchResult:
         """Create a search result from place data"""
-        return PlaceSearchResult(
-            id=place_data["id"],
-            name=place_data["name"],
-            formatted_address=place_data["formatted_address"],
-            types=place_data["types"],
-            center=Coordinates(**place_data["center"]),
-            bbox=self._calculate_bbox(place_data["center"]),
-            categories=place_data.get("categories", []),
-            score=score,
-            timezone=place_data.get("timezone"),
-            metadata=PlaceMetadata(
+        # Internal place data and a score clamped to [0, 1]: skip validation
+        return PlaceSearchResult.from_trusted({
+            "id": place_data["id"],
+            "name": place_data["name"],
+            "formatted_address": place_data["formatted_address"],
+            "types": place_data["types"],
+            "center": place_data["center"],
+            "bbox": self._calculate_bbox(place_data["center"]),
+            "categories": place_data.get("categories", []),
+            "score": score,
+            "timezone": place_data.get("timezone"),
+            "metadata": PlaceMetadata.model_construct(
                 country=place_data.get("country"),
                 postcode=place_data.get("postcode")
             ),
-            geometry_type=GeometryType.ROOFTOP
-        )
+            "geometry_type": GeometryType.ROOFTOP.value
+        })
     
     def _highlight_text(self, text: str, query: str) -> str:
         """Highlight matching text with HTML bold tags (supports Hebrew and English)"""
@@ -858,20 +876,20 @@ class PlacesService:
 
         return text
     
-    def _calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-        """Calculate distance between two points using Haversine formula"""
+    def _distances_from(self, user_location: Optional[Tuple[float, float]]) -> List[Optional[float]]:
+        """Haversine distances in meters from user_location to every place, in place order"""
+        if user_location is None:
+            return [None] * len(self._mock_places)
         R = 6371000  # Earth's radius in meters
         
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
+        lat1_rad = math.radians(user_location[0])
+        lng1_rad = math.radians(user_location[1])
         
-        a = (math.sin(delta_lat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        a = (np.sin((self._place_lat_rad - lat1_rad) / 2) ** 2 +
+             math.cos(lat1_rad) * self._place_cos_lat * np.sin((self._place_lng_rad - lng1_rad) / 2) ** 2)
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
         
-        return R * c
+        return (R * c).tolist()
     
     def _calculate_bbox(self, center: Dict[str, float], radius_m: float = 100) -> BoundingBox:
         """Calculate bounding box around a center point"""
@@ -882,11 +900,13 @@ class PlacesService:
         lat_delta = radius_m / 111000  # ~111km per degree latitude
         lng_delta = radius_m / (111000 * math.cos(math.radians(lat)))
         
+        # 7 decimals is ~1cm, the e7 precision of the stored coordinates;
+        # the remaining digits of the approximation are just payload bytes
         return BoundingBox(
-            minLat=lat - lat_delta,
-            minLng=lng - lng_delta,
-            maxLat=lat + lat_delta,
-            maxLng=lng + lng_delta
+            minLat=round(lat - lat_delta, 7),
+            minLng=round(lng - lng_delta, 7),
+            maxLat=round(lat + lat_delta, 7),
+            maxLng=round(lng + lng_delta, 7)
         )
     
     def get_uptime(self) -> int:
@@ -38,6 +38,16 @@ class Settings(BaseSettings):
     DB_NAME: str = Field(..., description="Database name")
     DB_USER: str = Field(..., description="Database username")
     DB_PASSWORD: str = Field(..., description="Database password")
+    DB_POOL_SIZE: int = Field(default=20, description="Persistent pooled connections")
+    DB_MAX_OVERFLOW: int = Field(
+        default=40, description="Extra connections allowed above DB_POOL_SIZE"
+    )
+    DB_POOL_TIMEOUT: int = Field(
+        default=30, description="Seconds to wait for a pooled connection"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800, description="Recycle pooled connections after this many seconds"
+    )
 
     # Location Database settings (separate database for location endpoints)
     LOCATION_DB_CLIENT: str = Field(
@@ -21,12 +21,24 @@ def _get_connect_args():
             "init_command": "SET sql_mode='STRICT_TRANS_TABLES'"
         }
 
+def _get_pool_args():
+    """Get connection pool sizing based on database type"""
+    if settings.database_url.startswith("sqlite://"):
+        # SQLite picks its own pool class; QueuePool sizing does not apply
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
-    pool_recycle=300,
     echo=settings.DEBUG,
-    connect_args=_get_connect_args()
+    connect_args=_get_connect_args(),
+    **_get_pool_args()
 )
 
 # Create session factory
@@ -36,6 +48,24 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def release_connection(db: Session) -> None:
+    """
+    Hand the session's pooled connection back before slow outbound work
+    (e.g. routing provider calls) without expiring already-loaded objects.
+
+    No-op if the session has pending changes, which are left for the caller
+    to commit.
+    """
+    if db.new or db.dirty or db.deleted:
+        return
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency to get database session
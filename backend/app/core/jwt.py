@@ -2,7 +2,8 @@
 JWT token management utilities
 """
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
@@ -99,8 +100,19 @@ def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+# Verified access tokens -> (user ID, exp). Clients reuse one token for bursts
+# of requests (type-ahead), so the signature check runs once per token; the
+# expiry is still checked on every hit. The cache is simply reset when full.
+_VERIFIED_TOKENS_MAX = 10_000
+_verified_tokens: Dict[str, Tuple[str, float]] = {}
+
+
 def get_user_id_from_token(token: str) -> str:
     """Extract user ID from token"""
+    cached = _verified_tokens.get(token)
+    if cached is not None and time.time() < cached[1]:
+        return cached[0]
+
     payload = verify_token(token)
     user_id = payload.get("sub")
     
@@ -111,6 +123,9 @@ def get_user_id_from_token(token: str) -> str:
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    if len(_verified_tokens) >= _VERIFIED_TOKENS_MAX:
+        _verified_tokens.clear()
+    _verified_tokens[token] = (user_id, float(payload["exp"]))
     return user_id
 
 def create_fake_token_for_testing(user_id: str) -> str:
@@ -17,9 +17,12 @@ class RateLimiter:
         self.window_seconds = window_seconds
         self.requests: Dict[str, deque] = defaultdict(deque)
     
+    # Request times are time.monotonic() readings, so wall-clock jumps
+    # (NTP, DST on naive clocks) cannot open or close a window early
+
     def allow_request(self, key: str) -> bool:
         """Check if request is allowed for the given key"""
-        now = time.time()
+        now = time.monotonic()
         window_start = now - self.window_seconds
         
         # Clean old requests
@@ -36,7 +39,7 @@ class RateLimiter:
     
     def get_remaining(self, key: str) -> int:
         """Get remaining requests for the key"""
-        now = time.time()
+        now = time.monotonic()
         window_start = now - self.window_seconds
         
         request_times = self.requests[key]
@@ -51,5 +54,6 @@ class RateLimiter:
         if not request_times:
             return int(time.time())
         
-        # Reset time is when the oldest request expires
-        return int(request_times[0] + self.window_seconds)
+        # Reset time is when the oldest request expires, as a Unix timestamp
+        expires_in = request_times[0] + self.window_seconds - time.monotonic()
+        return int(time.time() + expires_in)
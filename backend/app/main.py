@@ -1,12 +1,13 @@
 """
 RoadTrip Planner FastAPI Application
 """
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 from app.core.database import engine
@@ -29,6 +30,7 @@ from app.api.enums.router import router as enums_router
 from app.api.location.router import router as location_router
 from app.api.monitoring.router import router as monitoring_router
 from app.api.places.router import router as places_router
+from app.api.v1.places.endpoints import PlacesRateLimitMiddleware
 from app.api.routing.router import router as routing_router
 from app.api.settings.router import router as settings_router
 from app.api.stops.router import router as stops_router
@@ -57,16 +59,27 @@ from app.core.exception_handlers import (
 Base.metadata.create_all(bind=engine)
 
 
-# Charset middleware to ensure proper UTF-8 encoding
-class CharsetMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+# Charset middleware to ensure proper UTF-8 encoding. Plain ASGI: it only
+# rewrites the response-start headers, so unlike BaseHTTPMiddleware it adds no
+# extra task or body re-streaming to every request
+class CharsetMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Ensure JSON responses have proper charset
-        if response.headers.get("content-type", "").startswith("application/json"):
-            response.headers["content-type"] = "application/json; charset=utf-8"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        async def send_with_charset(message: Message):
+            if message["type"] == "http.response.start":
+                # Ensure JSON responses have proper charset
+                headers = MutableHeaders(scope=message)
+                if headers.get("content-type", "").startswith("application/json"):
+                    headers["content-type"] = "application/json; charset=utf-8"
+            await send(message)
+
+        await self.app(scope, receive, send_with_charset)
 
 
 app = FastAPI(
@@ -601,6 +614,10 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+# Reject rate-limited type-ahead requests before routing and auth (added
+# first so the charset and CORS middleware still wrap its 429s)
+app.add_middleware(PlacesRateLimitMiddleware)
+
 # Add charset middleware to ensure proper UTF-8 encoding
 app.add_middleware(CharsetMiddleware)
 
@@ -4,6 +4,7 @@ Base model classes and utilities with ISO-8601 datetime standardization
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import Column, DateTime, String
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declared_attr
 from ulid import ULID
 
@@ -25,8 +26,11 @@ class TimestampMixin:
         nullable=False,
         doc="Creation timestamp in UTC (ISO-8601: YYYY-MM-DDTHH:MM:SSZ)"
     )
+    # Stored to the microsecond (MySQL DATETIME defaults to whole seconds) so
+    # that two writes within the same second still change the value that
+    # content ETags are built from; the API still serializes whole seconds
     updated_at = Column(
-        DateTime(timezone=True),
+        DateTime(timezone=True).with_variant(mysql.DATETIME(fsp=6), "mysql"),
         default=DateTimeStandards.now_utc,
         onupdate=DateTimeStandards.now_utc,
         nullable=False,
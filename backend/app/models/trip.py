@@ -3,7 +3,7 @@ Trip and TripMember models
 """
 from sqlalchemy import (
     Column, String, Date, Boolean, Enum, ForeignKey,
-    UniqueConstraint, DateTime
+    UniqueConstraint, DateTime, Index, text
 )
 from sqlalchemy.orm import relationship
 import enum
@@ -70,6 +70,16 @@ class Trip(BaseModel, SoftDeleteMixin):
 
     __table_args__ = (
         UniqueConstraint("slug", "created_by", name="uq_trip_slug_creator"),
+        # Serves list_trips: owner + live rows (+ status filter), newest first
+        Index(
+            "ix_trips_list",
+            "created_by", "deleted_at", "status", text("created_at DESC"),
+        ),
+        # Serves keyset pages of list_trips: seek on (created_at, id) per owner
+        Index(
+            "ix_trips_keyset",
+            "created_by", "deleted_at", text("created_at DESC"), text("id DESC"),
+        ),
     )
 
     def __repr__(self):
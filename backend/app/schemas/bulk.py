@@ -70,6 +70,7 @@ class BulkOperationResult(BaseModel):
     skipped: int = Field(..., description="Number of skipped operations")
     items: List[BulkOperationResultItem] = Field(..., description="Results for each item")
     errors: List[str] = Field(default_factory=list, description="General errors not tied to specific items")
+    route_recompute_queued: List[str] = Field(default_factory=list, description="Day IDs whose routes are being recomputed in the background")
     
     @property
     def success_rate(self) -> float:
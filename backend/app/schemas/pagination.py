@@ -1,6 +1,8 @@
 """
 Enhanced pagination schemas with navigation links
 """
+import base64
+import json
 from typing import Optional, List, Generic, TypeVar, Dict, Any
 from pydantic import BaseModel, Field, computed_field
 from urllib.parse import urlencode
@@ -17,23 +19,43 @@ class PaginationLinks(BaseModel):
 
 class PaginationMeta(BaseModel):
     """Pagination metadata"""
-    current_page: int = Field(..., description="Current page number (1-based)")
+    current_page: Optional[int] = Field(
+        ..., description="Current page number (1-based; null on cursor pages)"
+    )
     per_page: int = Field(..., description="Items per page")
-    total_items: int = Field(..., description="Total number of items")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_items: Optional[int] = Field(
+        ..., description="Total number of items (null when the count was skipped)"
+    )
+    total_pages: Optional[int] = Field(
+        ..., description="Total number of pages (null when the count was skipped)"
+    )
     has_next: bool = Field(..., description="Whether there is a next page")
-    has_prev: bool = Field(..., description="Whether there is a previous page")
+    has_prev: Optional[bool] = Field(
+        ..., description="Whether there is a previous page (null on cursor pages)"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (keyset pagination)"
+    )
     
     @computed_field
     @property
-    def from_item(self) -> int:
+    def from_item(self) -> Optional[int]:
         """First item number on current page"""
+        if self.current_page is None:
+            # A cursor page has no known position in the result set
+            return None
         return (self.current_page - 1) * self.per_page + 1
     
     @computed_field
     @property
-    def to_item(self) -> int:
+    def to_item(self) -> Optional[int]:
         """Last item number on current page"""
+        if self.current_page is None:
+            return None
+        if self.total_items is None:
+            # Without a count the total is only unknown while more pages
+            # remain, so the current page is full
+            return self.current_page * self.per_page
         return min(self.current_page * self.per_page, self.total_items)
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -45,9 +67,12 @@ class PaginatedResponse(BaseModel, Generic[T]):
 def build_pagination_links(
     base_url: str,
     current_page: int,
-    total_pages: int,
+    total_pages: Optional[int],
     per_page: int,
-    query_params: Optional[Dict[str, Any]] = None
+    query_params: Optional[Dict[str, Any]] = None,
+    has_next: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    next_cursor: Optional[str] = None
 ) -> PaginationLinks:
     """
     Build pagination navigation links
@@ -55,9 +80,13 @@ def build_pagination_links(
     Args:
         base_url: Base URL without query parameters
         current_page: Current page number (1-based)
-        total_pages: Total number of pages
+        total_pages: Total number of pages, or None when not counted
         per_page: Items per page
         query_params: Additional query parameters to preserve
+        has_next: Whether a next page exists; used when total_pages is None
+            or when paging by cursor
+        cursor: Keyset cursor the current page was fetched with, if any
+        next_cursor: Keyset cursor for the page after this one, if any
     
     Returns:
         PaginationLinks object with navigation URLs
@@ -65,20 +94,44 @@ def build_pagination_links(
     if query_params is None:
         query_params = {}
     
+    # Encode the preserved parameters once; only the page number varies
+    # between links (None values are dropped)
+    base_qs = urlencode({
+        k: v for k, v in query_params.items()
+        if v is not None and k not in ('page', 'size', 'cursor')
+    })
+    prefix = f"{base_url}?{base_qs}&" if base_qs else f"{base_url}?"
+    
     def build_url(page: int) -> str:
         """Build URL for specific page"""
-        params = {**query_params, 'page': page, 'size': per_page}
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
-        query_string = urlencode(params)
-        return f"{base_url}?{query_string}"
+        return f"{prefix}page={page}&size={per_page}"
+    
+    if cursor is not None:
+        # A keyset page only knows the way forward: next continues from
+        # next_cursor, and there is no page number for prev or last
+        def build_cursor_url(page_cursor: str) -> str:
+            return f"{prefix}{urlencode({'cursor': page_cursor})}&size={per_page}"
+        
+        return PaginationLinks(
+            self=build_cursor_url(cursor),
+            first=build_url(1),
+            last=None,
+            next=build_cursor_url(next_cursor) if has_next and next_cursor else None,
+            prev=None
+        )
+    
+    if total_pages is None:
+        last = None
+    else:
+        last = build_url(total_pages) if total_pages > 0 else build_url(1)
+        has_next = current_page < total_pages
     
     # Build navigation links
     links = PaginationLinks(
         self=build_url(current_page),
         first=build_url(1),
-        last=build_url(total_pages) if total_pages > 0 else build_url(1),
-        next=build_url(current_page + 1) if current_page < total_pages else None,
+        last=last,
+        next=build_url(current_page + 1) if has_next else None,
         prev=build_url(current_page - 1) if current_page > 1 else None
     )
     
@@ -86,35 +139,54 @@ def build_pagination_links(
 
 def create_paginated_response(
     items: List[T],
-    total_items: int,
+    total_items: Optional[int],
     current_page: int,
     per_page: int,
     base_url: str,
-    query_params: Optional[Dict[str, Any]] = None
+    query_params: Optional[Dict[str, Any]] = None,
+    next_cursor: Optional[str] = None,
+    has_next: Optional[bool] = None,
+    cursor: Optional[str] = None
 ) -> PaginatedResponse[T]:
     """
     Create a standardized paginated response
     
     Args:
         items: List of items for current page
-        total_items: Total number of items across all pages
+        total_items: Total number of items across all pages, or None when
+            the count was skipped (has_next must then be given)
         current_page: Current page number (1-based)
         per_page: Items per page
         base_url: Base URL for building navigation links
         query_params: Additional query parameters to preserve in links
+        next_cursor: Keyset cursor for the page after this one, if any
+        has_next: Whether a next page exists; used without total_items and
+            whenever the page was fetched by cursor
+        cursor: Keyset cursor this page was fetched with; current_page is
+            then meaningless, so the page position (current_page, has_prev,
+            from_item, to_item) is reported as null and has_next/links follow
+            the cursor instead
     
     Returns:
         PaginatedResponse with data, metadata, and navigation links
     """
-    total_pages = (total_items + per_page - 1) // per_page if total_items > 0 else 1
+    if total_items is None:
+        total_pages = None
+    else:
+        total_pages = (total_items + per_page - 1) // per_page if total_items > 0 else 1
+    if total_items is None or cursor is not None:
+        has_next = bool(has_next)
+    else:
+        has_next = current_page < total_pages
     
     meta = PaginationMeta(
-        current_page=current_page,
+        current_page=current_page if cursor is None else None,
         per_page=per_page,
         total_items=total_items,
         total_pages=total_pages,
-        has_next=current_page < total_pages,
-        has_prev=current_page > 1
+        has_next=has_next,
+        has_prev=current_page > 1 if cursor is None else None,
+        next_cursor=next_cursor
     )
     
     links = build_pagination_links(
@@ -122,7 +194,10 @@ def create_paginated_response(
         current_page=current_page,
         total_pages=total_pages,
         per_page=per_page,
-        query_params=query_params
+        query_params=query_params,
+        has_next=has_next,
+        cursor=cursor,
+        next_cursor=next_cursor
     )
     
     return PaginatedResponse(
@@ -131,6 +206,32 @@ def create_paginated_response(
         links=links
     )
 
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """
+    Encode keyset pagination values as an opaque URL-safe cursor
+    
+    Args:
+        values: JSON-serializable values identifying the last item of a page
+    
+    Returns:
+        Unpadded base64url string
+    """
+    raw = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    padded = cursor + '=' * (-len(cursor) % 4)
+    values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    if not isinstance(values, dict):
+        raise ValueError("Cursor must encode an object")
+    return values
+
 # Utility function to get base URL from request
 def get_base_url(request, path: str) -> str:
     """
@@ -227,9 +227,10 @@ class TripCreateResponse(BaseModel):
 class TripList(BaseModel):
     """Legacy trip list response schema (deprecated)"""
     trips: List[Trip]
-    total: int
+    total: Optional[int]
     page: int
     size: int
+    next_cursor: Optional[str] = None
 
 # Import enhanced pagination
 from app.schemas.pagination import PaginatedResponse
@@ -5,9 +5,11 @@ import logging
 from collections.abc import Callable
 from typing import Any, Optional
 
+from sqlalchemy import inspect, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.datetime_utils import DateTimeStandards
 from app.schemas.bulk import (
     BulkOperationLimits,
     BulkOperationResult,
@@ -35,6 +37,7 @@ class BulkOperationService:
         force: bool = False,
         pre_delete_hook: Optional[Callable] = None,
         post_delete_hook: Optional[Callable] = None,
+        preauthorized_ids: Optional[set[str]] = None,
     ) -> BulkOperationResult:
         """
         Perform bulk deletion of resources
@@ -46,6 +49,9 @@ class BulkOperationService:
             force: Whether to force deletion despite dependencies
             pre_delete_hook: Optional function to call before each deletion
             post_delete_hook: Optional function to call after each deletion
+            preauthorized_ids: IDs the caller already verified the user may
+                delete (one batched ownership query); other IDs are rejected
+                without being loaded and the per-row ownership check is skipped
         """
         results = []
         errors = []
@@ -60,105 +66,126 @@ class BulkOperationService:
         # Remove duplicates while preserving order
         unique_ids = list(dict.fromkeys(ids))
 
-        for resource_id in unique_ids:
-            try:
-                # Find the resource
-                resource = (
-                    self.db.query(model_class)
-                    .filter(model_class.id == resource_id)
-                    .first()
+        # Load every candidate row in one query instead of one per ID
+        candidate_ids = [
+            resource_id
+            for resource_id in unique_ids
+            if preauthorized_ids is None or resource_id in preauthorized_ids
+        ]
+        resources = {}
+        if candidate_ids:
+            resources = {
+                resource.id: resource
+                for resource in self.db.query(model_class).filter(
+                    model_class.id.in_(candidate_ids)
                 )
+            }
 
-                if not resource:
-                    results.append(
-                        BulkOperationResultItem(
-                            id=resource_id,
-                            status=BulkOperationStatus.FAILED,
-                            error="Resource not found",
-                            operation=BulkOperationType.DELETE,
-                        )
-                    )
-                    continue
-
-                # Check ownership/permissions (if model has created_by or similar)
-                if hasattr(resource, "created_by") and resource.created_by != user_id:
-                    results.append(
-                        BulkOperationResultItem(
-                            id=resource_id,
-                            status=BulkOperationStatus.FAILED,
-                            error="Permission denied",
-                            operation=BulkOperationType.DELETE,
-                        )
-                    )
-                    continue
-
-                # Pre-delete hook
-                if pre_delete_hook:
-                    try:
-                        await pre_delete_hook(resource)
-                    except Exception as e:
-                        results.append(
-                            BulkOperationResultItem(
-                                id=resource_id,
-                                status=BulkOperationStatus.FAILED,
-                                error=f"Pre-delete hook failed: {str(e)}",
-                                operation=BulkOperationType.DELETE,
-                            )
-                        )
-                        continue
-
-                # Perform deletion (soft delete if supported, hard delete otherwise)
-                if hasattr(resource, "soft_delete"):
-                    resource.soft_delete()
-                else:
-                    self.db.delete(resource)
-
-                # Post-delete hook
-                if post_delete_hook:
-                    try:
-                        await post_delete_hook(resource)
-                    except Exception as e:
-                        logger.warning(
-                            f"Post-delete hook failed for {resource_id}: {e}"
-                        )
+        soft_delete = hasattr(model_class, "deleted_at")
+        deleted = []
 
+        for resource_id in unique_ids:
+            if preauthorized_ids is not None and resource_id not in preauthorized_ids:
                 results.append(
                     BulkOperationResultItem(
                         id=resource_id,
-                        status=BulkOperationStatus.SUCCESS,
+                        status=BulkOperationStatus.FAILED,
+                        error="Resource not found or access denied",
                         operation=BulkOperationType.DELETE,
                     )
                 )
+                continue
 
-            except IntegrityError as e:
-                self.db.rollback()
-                error_msg = (
-                    "Cannot delete: resource has dependencies"
-                    if not force
-                    else f"Integrity error: {str(e)}"
-                )
+            resource = resources.get(resource_id)
+
+            if not resource:
                 results.append(
                     BulkOperationResultItem(
                         id=resource_id,
                         status=BulkOperationStatus.FAILED,
-                        error=error_msg,
+                        error="Resource not found",
                         operation=BulkOperationType.DELETE,
                     )
                 )
-            except Exception as e:
-                self.db.rollback()
+                continue
+
+            # Check ownership/permissions (if model has created_by or similar)
+            if (
+                preauthorized_ids is None
+                and hasattr(resource, "created_by")
+                and resource.created_by != user_id
+            ):
                 results.append(
                     BulkOperationResultItem(
                         id=resource_id,
                         status=BulkOperationStatus.FAILED,
-                        error=str(e),
+                        error="Permission denied",
                         operation=BulkOperationType.DELETE,
                     )
                 )
+                continue
+
+            # Pre-delete hook
+            if pre_delete_hook:
+                try:
+                    await pre_delete_hook(resource)
+                except Exception as e:
+                    results.append(
+                        BulkOperationResultItem(
+                            id=resource_id,
+                            status=BulkOperationStatus.FAILED,
+                            error=f"Pre-delete hook failed: {str(e)}",
+                            operation=BulkOperationType.DELETE,
+                        )
+                    )
+                    continue
+
+            # Hard deletes are queued per row; soft deletes are applied below
+            # as a single UPDATE for every accepted ID
+            if not soft_delete:
+                self.db.delete(resource)
+
+            deleted.append(resource)
+            results.append(
+                BulkOperationResultItem(
+                    id=resource_id,
+                    status=BulkOperationStatus.SUCCESS,
+                    operation=BulkOperationType.DELETE,
+                )
+            )
 
-        # Commit all successful deletions
+        # Apply all deletions and commit
         try:
+            if soft_delete and deleted:
+                self.db.execute(
+                    update(model_class)
+                    .where(model_class.id.in_([r.id for r in deleted]))
+                    .values(deleted_at=DateTimeStandards.now_utc())
+                )
+
+            # Post-delete hooks run before the commit expires the objects
+            if post_delete_hook:
+                for resource in deleted:
+                    try:
+                        await post_delete_hook(resource)
+                    except Exception as e:
+                        logger.warning(
+                            f"Post-delete hook failed for {resource.id}: {e}"
+                        )
+
             self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            error_msg = (
+                "Cannot delete: resource has dependencies"
+                if not force
+                else f"Integrity error: {str(e)}"
+            )
+            errors.append(f"Failed to commit bulk deletion: {error_msg}")
+            for result in results:
+                if result.status == BulkOperationStatus.SUCCESS:
+                    result.status = BulkOperationStatus.FAILED
+                    result.error = error_msg
         except Exception as e:
             self.db.rollback()
             errors.append(f"Failed to commit bulk deletion: {str(e)}")
@@ -178,6 +205,7 @@ class BulkOperationService:
         allowed_fields: Optional[list[str]] = None,
         pre_update_hook: Optional[Callable] = None,
         post_update_hook: Optional[Callable] = None,
+        preauthorized_ids: Optional[set[str]] = None,
     ) -> BulkOperationResult:
         """
         Perform bulk updates of resources
@@ -189,6 +217,9 @@ class BulkOperationService:
             allowed_fields: List of fields that can be updated
             pre_update_hook: Optional function to call before each update
             post_update_hook: Optional function to call after each update
+            preauthorized_ids: IDs the caller already verified the user may
+                update (one batched ownership query); other IDs are rejected
+                without being loaded and the per-row ownership check is skipped
         """
         results = []
         errors = []
@@ -200,6 +231,26 @@ class BulkOperationService:
             )
             return create_bulk_result([], errors)
 
+        # Load every candidate row in one query instead of one per ID
+        candidate_ids = {
+            update_item.get("id")
+            for update_item in updates
+            if update_item.get("id")
+            and (preauthorized_ids is None or update_item["id"] in preauthorized_ids)
+        }
+        resources = {}
+        if candidate_ids:
+            resources = {
+                resource.id: resource
+                for resource in self.db.query(model_class).filter(
+                    model_class.id.in_(candidate_ids)
+                )
+            }
+
+        column_keys = {attr.key for attr in inspect(model_class).column_attrs}
+        mappings = []
+        updated = []
+
         for update_item in updates:
             resource_id = update_item.get("id")
             update_data = update_item.get("data", {})
@@ -215,107 +266,108 @@ class BulkOperationService:
                 )
                 continue
 
-            try:
-                # Find the resource
-                resource = (
-                    self.db.query(model_class)
-                    .filter(model_class.id == resource_id)
-                    .first()
+            if preauthorized_ids is not None and resource_id not in preauthorized_ids:
+                results.append(
+                    BulkOperationResultItem(
+                        id=resource_id,
+                        status=BulkOperationStatus.FAILED,
+                        error="Resource not found or access denied",
+                        operation=BulkOperationType.UPDATE,
+                    )
                 )
+                continue
 
-                if not resource:
-                    results.append(
-                        BulkOperationResultItem(
-                            id=resource_id,
-                            status=BulkOperationStatus.FAILED,
-                            error="Resource not found",
-                            operation=BulkOperationType.UPDATE,
-                        )
+            resource = resources.get(resource_id)
+
+            if not resource:
+                results.append(
+                    BulkOperationResultItem(
+                        id=resource_id,
+                        status=BulkOperationStatus.FAILED,
+                        error="Resource not found",
+                        operation=BulkOperationType.UPDATE,
                     )
-                    continue
+                )
+                continue
 
-                # Check ownership/permissions
-                if hasattr(resource, "created_by") and resource.created_by != user_id:
+            # Check ownership/permissions
+            if (
+                preauthorized_ids is None
+                and hasattr(resource, "created_by")
+                and resource.created_by != user_id
+            ):
+                results.append(
+                    BulkOperationResultItem(
+                        id=resource_id,
+                        status=BulkOperationStatus.FAILED,
+                        error="Permission denied",
+                        operation=BulkOperationType.UPDATE,
+                    )
+                )
+                continue
+
+            # Filter allowed fields
+            if allowed_fields:
+                filtered_data = {
+                    k: v for k, v in update_data.items() if k in allowed_fields
+                }
+                if len(filtered_data) != len(update_data):
+                    logger.warning(f"Some fields filtered out for update {resource_id}")
+                update_data = filtered_data
+
+            # Pre-update hook
+            if pre_update_hook:
+                try:
+                    update_data = (
+                        await pre_update_hook(resource, update_data) or update_data
+                    )
+                except Exception as e:
                     results.append(
                         BulkOperationResultItem(
                             id=resource_id,
                             status=BulkOperationStatus.FAILED,
-                            error="Permission denied",
+                            error=f"Pre-update hook failed: {str(e)}",
                             operation=BulkOperationType.UPDATE,
                         )
                     )
                     continue
 
-                # Filter allowed fields
-                if allowed_fields:
-                    filtered_data = {
-                        k: v for k, v in update_data.items() if k in allowed_fields
-                    }
-                    if len(filtered_data) != len(update_data):
-                        logger.warning(
-                            f"Some fields filtered out for update {resource_id}"
-                        )
-                    update_data = filtered_data
-
-                # Pre-update hook
-                if pre_update_hook:
-                    try:
-                        update_data = (
-                            await pre_update_hook(resource, update_data) or update_data
-                        )
-                    except Exception as e:
-                        results.append(
-                            BulkOperationResultItem(
-                                id=resource_id,
-                                status=BulkOperationStatus.FAILED,
-                                error=f"Pre-update hook failed: {str(e)}",
-                                operation=BulkOperationType.UPDATE,
-                            )
-                        )
-                        continue
-
-                # Apply updates
-                for field, value in update_data.items():
-                    if hasattr(resource, field):
-                        setattr(resource, field, value)
-
-                # Update timestamp if available
-                if hasattr(resource, "updated_at"):
-                    from datetime import datetime
+            # Queue the row for the batched UPDATE below
+            mapping = {
+                field: value
+                for field, value in update_data.items()
+                if field in column_keys
+            }
+            if "updated_at" in column_keys:
+                mapping["updated_at"] = DateTimeStandards.now_utc()
+            mapping["id"] = resource_id
+            mappings.append(mapping)
+            updated.append((resource, update_data))
+
+            results.append(
+                BulkOperationResultItem(
+                    id=resource_id,
+                    status=BulkOperationStatus.SUCCESS,
+                    operation=BulkOperationType.UPDATE,
+                    data={"updated_fields": list(update_data.keys())},
+                )
+            )
 
-                    resource.updated_at = datetime.utcnow()
+        # Apply all updates as one executemany batch and commit
+        try:
+            if mappings:
+                self.db.bulk_update_mappings(model_class, mappings)
 
-                # Post-update hook
-                if post_update_hook:
+            # Post-update hooks run before the commit expires the objects
+            if post_update_hook:
+                for resource, update_data in updated:
                     try:
                         await post_update_hook(resource, update_data)
                     except Exception as e:
                         logger.warning(
-                            f"Post-update hook failed for {resource_id}: {e}"
+                            f"Post-update hook failed for {resource.id}: {e}"
                         )
 
-                results.append(
-                    BulkOperationResultItem(
-                        id=resource_id,
-                        status=BulkOperationStatus.SUCCESS,
-                        operation=BulkOperationType.UPDATE,
-                        data={"updated_fields": list(update_data.keys())},
-                    )
-                )
-
-            except Exception as e:
-                self.db.rollback()
-                results.append(
-                    BulkOperationResultItem(
-                        id=resource_id,
-                        status=BulkOperationStatus.FAILED,
-                        error=str(e),
-                        operation=BulkOperationType.UPDATE,
-                    )
-                )
-
-        # Commit all successful updates
-        try:
             self.db.commit()
         except Exception as e:
             self.db.rollback()
@@ -161,3 +161,40 @@ class TestAuthLogin:
         
         assert user1["id"] == user2["id"]
         assert user1["email"] == user2["email"]
+
+
+class TestVerifiedTokenCache:
+    """Test reuse of verified access tokens"""
+
+    def test_repeat_token_skips_signature_check(self, monkeypatch):
+        """Test that a verified token is not decoded again"""
+        from app.core import jwt as jwt_utils
+
+        token = jwt_utils.create_access_token({"sub": "user-1"})
+        assert jwt_utils.get_user_id_from_token(token) == "user-1"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("token decoded twice")
+
+        monkeypatch.setattr(jwt_utils, "verify_token", fail)
+        assert jwt_utils.get_user_id_from_token(token) == "user-1"
+
+    def test_cached_token_still_expires(self, monkeypatch):
+        """Test that a cached token is rejected once its exp has passed"""
+        import time
+
+        from fastapi import HTTPException
+
+        from app.core import jwt as jwt_utils
+
+        token = jwt_utils.create_access_token({"sub": "user-1"})
+        jwt_utils.get_user_id_from_token(token)
+
+        def expired(token):
+            raise HTTPException(status_code=401, detail="Token has expired")
+
+        expired_at = time.time() + 31 * 60
+        monkeypatch.setattr(jwt_utils.time, "time", lambda: expired_at)
+        monkeypatch.setattr(jwt_utils, "verify_token", expired)
+        with pytest.raises(HTTPException):
+            jwt_utils.get_user_id_from_token(token)
@@ -37,7 +37,7 @@ class TestHealthEndpoint:
         response = client.get("/health")
         
         assert response.status_code == 200
-        assert response.headers["content-type"].startswith("application/json")
+        assert response.headers["content-type"] == "application/json; charset=utf-8"
         
         data = response.json()
         assert isinstance(data, dict)
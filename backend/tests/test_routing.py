@@ -132,3 +132,48 @@ class TestRoutingServiceIntegration:
             # If no routing endpoints exist, that's also acceptable for now
             # This indicates the routing feature is not yet implemented
             pass
+
+
+class TestRouteFingerprint:
+    """Test the route cache fingerprint"""
+
+    @staticmethod
+    def _stops(**overrides):
+        from types import SimpleNamespace
+
+        from app.models.stop import StopKind
+
+        def stop(stop_id, seq, kind, lat, lon):
+            return SimpleNamespace(
+                id=stop_id, seq=seq, kind=kind, fixed=kind != StopKind.VIA,
+                notes=None, place=SimpleNamespace(lat=lat, lon=lon),
+            )
+
+        stops = [
+            stop("s1", 1, StopKind.START, 32.08, 34.78),
+            stop("s2", 2, StopKind.VIA, 32.79, 34.99),
+            stop("s3", 3, StopKind.END, 31.77, 35.21),
+        ]
+        for attr, value in overrides.items():
+            setattr(stops[1], attr, value)
+        return stops
+
+    def test_fingerprint_ignores_non_geometric_fields(self):
+        from app.api.routing.router import route_fingerprint
+        from app.schemas.route import RouteComputeRequest
+
+        req = RouteComputeRequest(profile="car", optimize=True)
+        assert route_fingerprint(self._stops(), req) == route_fingerprint(
+            self._stops(notes="lunch here"), req
+        )
+
+    def test_fingerprint_changes_with_sequence_and_request(self):
+        from app.api.routing.router import route_fingerprint
+        from app.schemas.route import RouteComputeRequest
+
+        req = RouteComputeRequest(profile="car", optimize=True)
+        base = route_fingerprint(self._stops(), req)
+        assert base != route_fingerprint(self._stops(seq=5), req)
+        assert base != route_fingerprint(
+            self._stops(), RouteComputeRequest(profile="bike", optimize=True)
+        )
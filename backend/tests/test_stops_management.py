@@ -397,6 +397,191 @@ class TestStopsManagement:
         
         assert response.status_code in [401, 403]
 
+    def test_bulk_delete_soft_deletes_owned_stops(self, client: TestClient, auth_headers: dict, test_trip: Trip, test_day: Day, test_place: Place, db_session: Session):
+        """Test that bulk delete soft-deletes every owned stop and reports unknown IDs"""
+        stops = [
+            Stop(
+                day_id=test_day.id,
+                trip_id=test_trip.id,
+                place_id=test_place.id,
+                seq=seq,
+                kind=StopKind.VIA,
+                stop_type=StopType.FOOD
+            )
+            for seq in (1, 2)
+        ]
+        db_session.add_all(stops)
+        db_session.commit()
+
+        response = client.request(
+            "DELETE",
+            "/stops/bulk",
+            json={"ids": [stops[0].id, stops[1].id, "missing-stop-id"]},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["successful"] == 2
+        assert data["failed"] == 1
+        for stop in stops:
+            db_session.refresh(stop)
+            assert stop.deleted_at is not None
+
+    def test_bulk_delete_loads_places_in_one_query(self, client: TestClient, auth_headers: dict, test_trip: Trip, test_day: Day, test_place: Place, db_session: Session):
+        """Test that bulk delete reads waypoint coordinates without a per-stop place lookup"""
+        from sqlalchemy import event
+
+        from tests.conftest import test_engine
+
+        stops = [
+            Stop(
+                day_id=test_day.id,
+                trip_id=test_trip.id,
+                place_id=test_place.id,
+                seq=seq,
+                kind=StopKind.VIA,
+                stop_type=StopType.FOOD
+            )
+            for seq in (1, 2, 3)
+        ]
+        db_session.add_all(stops)
+        db_session.commit()
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", capture)
+        try:
+            response = client.request(
+                "DELETE",
+                "/stops/bulk",
+                json={"ids": [stop.id for stop in stops]},
+                headers=auth_headers
+            )
+        finally:
+            event.remove(test_engine, "before_cursor_execute", capture)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["successful"] == 3
+        assert data["route_recompute_queued"] == [test_day.id]
+        place_selects = [
+            statement for statement in statements
+            if statement.lstrip().startswith("SELECT") and "FROM places" in statement
+        ]
+        assert place_selects == []
+
+    def test_bulk_delete_failed_commit_queues_no_recompute(self, client: TestClient, auth_headers: dict, test_trip: Trip, test_day: Day, test_place: Place, db_session: Session, monkeypatch):
+        """Test that a bulk delete whose commit fails leaves no route recompute queued"""
+        from sqlalchemy.exc import IntegrityError
+
+        from app.services.bulk_operations import BulkOperationService
+
+        stops = [
+            Stop(
+                day_id=test_day.id,
+                trip_id=test_trip.id,
+                place_id=test_place.id,
+                seq=seq,
+                kind=StopKind.VIA,
+                stop_type=StopType.FOOD
+            )
+            for seq in (1, 2)
+        ]
+        db_session.add_all(stops)
+        db_session.commit()
+
+        original_delete = BulkOperationService.bulk_delete
+
+        async def failing_delete(self, *args, **kwargs):
+            def fail():
+                raise IntegrityError("UPDATE stops", {}, Exception("constraint failed"))
+
+            monkeypatch.setattr(self.db, "commit", fail)
+            return await original_delete(self, *args, **kwargs)
+
+        monkeypatch.setattr(BulkOperationService, "bulk_delete", failing_delete)
+
+        response = client.request(
+            "DELETE",
+            "/stops/bulk",
+            json={"ids": [stop.id for stop in stops]},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["successful"] == 0
+        assert data["failed"] == 2
+        assert data["route_recompute_queued"] == []
+
+    def test_bulk_update_applies_every_row(self, client: TestClient, auth_headers: dict, test_trip: Trip, test_day: Day, test_place: Place, db_session: Session):
+        """Test that bulk update writes each owned stop's allowed fields"""
+        stops = [
+            Stop(
+                day_id=test_day.id,
+                trip_id=test_trip.id,
+                place_id=test_place.id,
+                seq=seq,
+                kind=StopKind.VIA,
+                stop_type=StopType.FOOD
+            )
+            for seq in (1, 2)
+        ]
+        db_session.add_all(stops)
+        db_session.commit()
+
+        response = client.patch(
+            "/stops/bulk",
+            json={
+                "updates": [
+                    {"id": stops[0].id, "data": {"notes": "First", "stop_type": "ATTRACTION"}},
+                    {"id": stops[1].id, "data": {"notes": "Second", "kind": "start"}},
+                ]
+            },
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["successful"] == 2
+        db_session.refresh(stops[0])
+        db_session.refresh(stops[1])
+        assert stops[0].notes == "First"
+        assert stops[0].stop_type == StopType.ATTRACTION
+        assert stops[1].notes == "Second"
+        # Fields outside the allowed list are dropped
+        assert stops[1].kind == StopKind.VIA
+
+    def test_bulk_delete_rejects_non_owner(self, client: TestClient, test_trip: Trip, test_day: Day, test_place: Place, db_session: Session):
+        """Test that bulk delete only touches stops on the caller's trips"""
+        stop = Stop(
+            day_id=test_day.id,
+            trip_id=test_trip.id,
+            place_id=test_place.id,
+            seq=1,
+            kind=StopKind.VIA,
+            stop_type=StopType.FOOD
+        )
+        other_user = User(email="other@example.com", display_name="Other User")
+        db_session.add_all([stop, other_user])
+        db_session.commit()
+        other_headers = {"Authorization": f"Bearer fake_token_{other_user.id}"}
+
+        response = client.request(
+            "DELETE", "/stops/bulk", json={"ids": [stop.id]}, headers=other_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["successful"] == 0
+        assert data["failed"] == 1
+        db_session.refresh(stop)
+        assert stop.deleted_at is None
+
 
 @pytest.mark.stops
 class TestStopsValidation:
@@ -3,7 +3,9 @@ Tests for trips API endpoints
 """
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from app.models.trip import Trip, TripStatus
+from app.models.user import User
 
 
 class TestTripsCreate:
@@ -162,6 +164,72 @@ class TestTripsCreate:
             else:
                 assert data["slug"] == expected_slug
 
+    def test_create_trip_does_not_reload_row(self, client: TestClient, auth_headers: dict, test_user):
+        """Test that creating a trip is one auth lookup plus the INSERT"""
+        from tests.conftest import test_engine
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split()[0])
+
+        event.listen(test_engine, "before_cursor_execute", capture)
+        try:
+            response = client.post("/trips/", json={"title": "Fresh Trip"}, headers=auth_headers)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", capture)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created_by_user"]["email"] == test_user.email
+        assert data["members"] == []
+        assert statements == ["SELECT", "INSERT"]
+
+    def test_create_trip_duplicate_titles_get_numbered_slugs(self, client: TestClient, auth_headers: dict):
+        """Test that repeated titles get -1, -2 suffixes, including after a delete"""
+        slugs = []
+        for _ in range(3):
+            response = client.post("/trips/", json={"title": "Road_Trip"}, headers=auth_headers)
+            assert response.status_code == 200
+            slugs.append(response.json()["slug"])
+
+        assert slugs == ["road_trip", "road_trip-1", "road_trip-2"]
+
+        # A soft-deleted trip keeps its slug reserved
+        client.delete("/trips/road_trip-2", headers=auth_headers)
+        response = client.post("/trips/", json={"title": "Road_Trip"}, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["slug"] == "road_trip-3"
+
+    def test_create_trip_slug_race_falls_back_to_random_suffix(self, client: TestClient, auth_headers: dict, monkeypatch):
+        """Test a suffix taken concurrently is retried with a random tail instead of failing"""
+        client.post("/trips/", json={"title": "Race"}, headers=auth_headers)
+        # Simulate a concurrent create claiming the free suffix first
+        monkeypatch.setattr("app.api.trips.router._free_slug", lambda db, user_id, base: base)
+
+        response = client.post("/trips/", json={"title": "Race"}, headers=auth_headers)
+        assert response.status_code == 200
+        slug = response.json()["slug"]
+        assert slug.startswith("race-") and len(slug) == len("race-") + 6
+
+    @pytest.mark.parametrize(
+        "message, collision",
+        [
+            ("(1062, \"Duplicate entry 'race-u1' for key 'trips.uq_trip_slug_creator'\")", True),
+            ("UNIQUE constraint failed: trips.slug, trips.created_by", True),
+            ("NOT NULL constraint failed: trips.title", False),
+            ("(1452, 'Cannot add or update a child row: a foreign key constraint fails')", False),
+        ],
+    )
+    def test_create_trip_retries_only_slug_collisions(self, message: str, collision: bool):
+        """Test only uq_trip_slug_creator violations count as slug collisions"""
+        from sqlalchemy.exc import IntegrityError
+
+        from app.api.trips.router import _is_slug_collision
+
+        error = IntegrityError("INSERT INTO trips", {}, Exception(message))
+        assert _is_slug_collision(error) is collision
+
     def test_create_trip_with_invalid_date_format(self, client: TestClient, auth_headers: dict):
         """Test creating a trip with invalid date format"""
         trip_data = {
@@ -178,6 +246,31 @@ class TestTripsCreate:
         assert response.status_code == 422
 
 
+class TestGenerateSlug:
+    """Test slug generation from trip titles"""
+
+    @pytest.mark.parametrize(
+        "title",
+        [
+            "Summer Road Trip 2024",
+            "  Japan -- Tokyo & Kyoto!! (spring)  ",
+            "Café déjà vu",
+            "snake_case_title",
+            "x!-!y",
+            "!!!",
+        ],
+    )
+    def test_matches_regex_definition(self, title: str):
+        """Test the single-pass slug equals the original two regex passes"""
+        import re
+
+        from app.api.trips.router import generate_slug
+
+        expected = re.sub(r"[-\s]+", "-", re.sub(r"[^\w\s-]", "", title.lower()))
+        expected = expected.strip("-")[:100] or "untitled-trip"
+        assert generate_slug(title) == expected
+
+
 class TestTripsList:
     """Test trips listing endpoint"""
 
@@ -213,6 +306,233 @@ class TestTripsList:
             assert "status" in trip
             assert "created_at" in trip
 
+    def test_list_trips_total_counts_all_pages(self, client: TestClient, auth_headers: dict, multiple_test_trips: list):
+        """Test that total reflects the whole filtered set, not just the page"""
+        response = client.get("/trips/?page=2&size=2", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["trips"]) == 1
+        assert data["total"] == 3
+
+        # Past the last page the total is still reported
+        response = client.get("/trips/?page=5&size=2", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["trips"] == []
+        assert data["total"] == 3
+
+    @pytest.mark.parametrize("fmt", ["legacy", "modern"])
+    def test_list_trips_query_count_is_constant(self, client: TestClient, auth_headers: dict, multiple_test_trips: list, fmt: str):
+        """Test that listing trips does not issue per-trip lazy loads"""
+        from tests.conftest import test_engine
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", capture)
+        try:
+            response = client.get(f"/trips/?format={fmt}", headers=auth_headers)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", capture)
+
+        assert response.status_code == 200
+        # auth user lookup + page with total + owners IN + members IN
+        assert len(statements) <= 4
+
+    def test_list_trips_short_format_batches_days(self, client: TestClient, auth_headers: dict, multiple_test_trips: list, test_place, db_session):
+        """Test that the short format loads days and stops for the whole page at once"""
+        from app.models.day import Day
+        from app.models.stop import Stop, StopKind
+        from tests.conftest import test_engine
+
+        for trip in multiple_test_trips:
+            days = [Day(trip_id=trip.id, seq=seq) for seq in (1, 2)]
+            db_session.add_all(days)
+            db_session.flush()
+            db_session.add_all([
+                Stop(day_id=days[0].id, trip_id=trip.id, place_id=test_place.id, seq=seq, kind=kind)
+                for seq, kind in ((1, StopKind.START), (2, StopKind.VIA), (3, StopKind.VIA))
+            ])
+        db_session.commit()
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", capture)
+        try:
+            response = client.get("/trips/?format=short", headers=auth_headers)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", capture)
+
+        assert response.status_code == 200
+        trips = response.json()["data"]
+        assert [trip["total_days"] for trip in trips] == [2, 2, 2]
+        assert trips[0]["days"] == [
+            {"day": 1, "start": True, "stops": 3, "end": False},
+            {"day": 2, "start": False, "stops": 0, "end": False},
+        ]
+        # auth + page + days IN + stops IN, whatever the page size; the short
+        # format loads neither owners nor members
+        assert len(statements) == 4
+
+    def test_list_trips_modern_links(self, client: TestClient, auth_headers: dict, multiple_test_trips: list):
+        """Test navigation links keep filters and format ahead of page and size"""
+        response = client.get(
+            "/trips/?format=modern&page=2&size=1&sort_by=title:asc", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        links = response.json()["links"]
+        assert links["self"].endswith("/trips?sort_by=title%3Aasc&format=modern&page=2&size=1")
+        assert links["first"].endswith("/trips?sort_by=title%3Aasc&format=modern&page=1&size=1")
+        assert links["last"].endswith("/trips?sort_by=title%3Aasc&format=modern&page=3&size=1")
+        assert links["next"].endswith("&page=3&size=1")
+        assert links["prev"].endswith("&page=1&size=1")
+
+    @pytest.mark.parametrize("direction", ["desc", "asc"])
+    def test_list_trips_cursor_walks_every_trip_once(self, client: TestClient, auth_headers: dict, db_session, test_user, direction: str):
+        """Test keyset pagination visits each trip exactly once, ties included"""
+        from datetime import datetime
+
+        stamps = [datetime(2025, 1, 1), datetime(2025, 1, 2), datetime(2025, 1, 2), datetime(2025, 1, 3), datetime(2025, 1, 4)]
+        trips = [
+            Trip(slug=f"keyset-{i}", title=f"Keyset {i}", created_by=test_user.id, created_at=stamp)
+            for i, stamp in enumerate(stamps)
+        ]
+        db_session.add_all(trips)
+        db_session.commit()
+        expected = sorted(trips, key=lambda t: (t.created_at, t.id), reverse=direction == "desc")
+
+        seen = []
+        url = f"/trips/?size=2&sort_by=created_at:{direction}"
+        response = client.get(url, headers=auth_headers)
+        assert response.json()["total"] == 5
+        while True:
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(trip["id"] for trip in data["trips"])
+            if not data["next_cursor"]:
+                break
+            response = client.get(f"{url}&cursor={data['next_cursor']}", headers=auth_headers)
+
+        assert seen == [trip.id for trip in expected]
+
+    def test_list_trips_cursor_in_modern_meta(self, client: TestClient, auth_headers: dict, multiple_test_trips: list):
+        """Test the modern format exposes next_cursor only while more trips remain"""
+        response = client.get("/trips/?format=modern&size=2", headers=auth_headers)
+        meta = response.json()["meta"]
+        assert meta["next_cursor"]
+
+        response = client.get(
+            f"/trips/?format=modern&size=2&cursor={meta['next_cursor']}", headers=auth_headers
+        )
+        data = response.json()
+        assert len(data["data"]) == 1
+        assert data["meta"]["next_cursor"] is None
+
+    @pytest.mark.parametrize("fmt", ["modern", "short"])
+    def test_list_trips_cursor_links_follow_keyset(self, client: TestClient, auth_headers: dict, db_session, test_user, fmt: str):
+        """Test cursor pages link onward by cursor and end with has_next false"""
+        db_session.add_all(
+            Trip(slug=f"links-{i}", title=f"Links {i}", created_by=test_user.id)
+            for i in range(5)
+        )
+        db_session.commit()
+
+        response = client.get(f"/trips/?format={fmt}&size=2", headers=auth_headers)
+        data = response.json()
+        seen = [trip["id"] for trip in data["data"]]
+        cursor = data["meta"]["next_cursor"]
+        url = f"/trips/?format={fmt}&size=2&cursor={cursor}"
+        while True:
+            response = client.get(url.replace("http://testserver", ""), headers=auth_headers)
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(trip["id"] for trip in data["data"])
+            links = data["links"]
+            assert links["last"] is None
+            assert links["prev"] is None
+            if not data["meta"]["has_next"]:
+                break
+            assert "cursor=" in links["next"]
+            assert "page=" not in links["next"]
+            url = links["next"]
+
+        assert data["meta"]["has_next"] is False
+        assert data["meta"]["next_cursor"] is None
+        assert links["next"] is None
+        assert len(seen) == len(set(seen)) == 5
+
+    def test_list_trips_cursor_page_has_no_position(self, client: TestClient, auth_headers: dict, multiple_test_trips: list):
+        """Test cursor pages leave the page position null and skip the count unless asked"""
+        from tests.conftest import test_engine
+
+        response = client.get("/trips/?format=modern&size=2", headers=auth_headers)
+        cursor = response.json()["meta"]["next_cursor"]
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(test_engine, "before_cursor_execute", capture)
+        try:
+            response = client.get(f"/trips/?format=modern&size=2&cursor={cursor}", headers=auth_headers)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", capture)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["data"]) == 1
+        meta = data["meta"]
+        assert meta["current_page"] is None
+        assert meta["has_prev"] is None
+        assert meta["from_item"] is None
+        assert meta["to_item"] is None
+        assert meta["total_items"] is None
+        assert meta["has_next"] is False
+        assert not any("count(" in statement for statement in statements)
+        assert "include_total" not in data["links"]["first"]
+
+        response = client.get(
+            f"/trips/?format=modern&size=2&cursor={cursor}&include_total=true", headers=auth_headers
+        )
+        meta = response.json()["meta"]
+        assert meta["total_items"] == 3
+        assert meta["current_page"] is None
+
+    def test_list_trips_rejects_bad_cursor(self, client: TestClient, auth_headers: dict):
+        """Test malformed cursors and cursors on non-keyset sorts are rejected"""
+        response = client.get("/trips/?cursor=not-a-cursor", headers=auth_headers)
+        assert response.status_code == 400
+
+        from app.schemas.pagination import encode_cursor
+
+        cursor = encode_cursor({"ts": "2025-01-01T00:00:00", "id": "x"})
+        response = client.get(f"/trips/?cursor={cursor}&sort_by=title:asc", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_list_trips_without_total(self, client: TestClient, auth_headers: dict, multiple_test_trips: list):
+        """Test include_total=false leaves the total unknown until the last page"""
+        response = client.get("/trips/?format=modern&size=2&include_total=false", headers=auth_headers)
+        data = response.json()
+        assert len(data["data"]) == 2
+        assert data["meta"]["total_items"] is None
+        assert data["meta"]["total_pages"] is None
+        assert data["meta"]["has_next"] is True
+        assert data["links"]["last"] is None
+        assert "include_total=false" in data["links"]["next"]
+
+        response = client.get(data["links"]["next"], headers=auth_headers)
+        data = response.json()
+        assert len(data["data"]) == 1
+        assert data["meta"]["total_items"] == 3
+        assert data["meta"]["has_next"] is False
+
     def test_list_trips_without_authentication(self, client: TestClient):
         """Test listing trips without authentication should fail"""
         response = client.get("/trips/")
@@ -240,6 +560,24 @@ class TestTripsGet:
 
         assert response.status_code == 404
 
+    def test_get_trip_by_shared_slug(self, client: TestClient, auth_headers: dict, db_session, test_trip: Trip):
+        """Test that another user's trip with the same slug does not shadow ours"""
+        other_user = User(email="other@example.com", display_name="Other User")
+        db_session.add(other_user)
+        db_session.commit()
+        db_session.add(
+            Trip(slug=test_trip.slug, title="Other Trip", created_by=other_user.id)
+        )
+        db_session.commit()
+
+        response = client.get(f"/trips/{test_trip.slug}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["id"] == test_trip.id
+
+        other_headers = {"Authorization": f"Bearer fake_token_{other_user.id}"}
+        response = client.get(f"/trips/{test_trip.id}", headers=other_headers)
+        assert response.status_code == 403
+
     def test_get_trip_without_authentication(self, client: TestClient, test_trip: Trip):
         """Test getting a trip without authentication"""
         response = client.get(f"/trips/{test_trip.id}")
@@ -249,6 +587,95 @@ class TestTripsGet:
         assert response.status_code in [200, 401]
 
 
+    @pytest.mark.parametrize("include_place", ["true", "false"])
+    def test_get_trip_complete_summary(self, client: TestClient, auth_headers: dict, test_trip: Trip, test_place, db_session, include_place: str):
+        """Test the complete view counts days and stops by status and type without lazy loads"""
+        from app.models.day import Day, DayStatus
+        from app.models.stop import Stop, StopKind, StopType
+
+        days = [
+            Day(trip_id=test_trip.id, seq=1, status=DayStatus.ACTIVE),
+            Day(trip_id=test_trip.id, seq=2, status=DayStatus.ACTIVE),
+            Day(trip_id=test_trip.id, seq=3, status=DayStatus.INACTIVE),
+        ]
+        db_session.add_all(days)
+        db_session.flush()
+        db_session.add_all([
+            Stop(day_id=days[0].id, trip_id=test_trip.id, place_id=test_place.id, seq=1, kind=StopKind.START, stop_type=StopType.ACCOMMODATION),
+            Stop(day_id=days[0].id, trip_id=test_trip.id, place_id=test_place.id, seq=2, kind=StopKind.VIA, stop_type=StopType.FOOD),
+            Stop(day_id=days[1].id, trip_id=test_trip.id, place_id=test_place.id, seq=1, kind=StopKind.VIA, stop_type=StopType.FOOD),
+        ])
+        db_session.commit()
+
+        # Days and stops are raiseload("*"); any lazy relationship access fails
+        response = client.get(f"/trips/{test_trip.id}/complete?include_place={include_place}", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [len(day["stops"]) for day in data["days"]] == [2, 1, 0]
+        assert data["summary"]["total_days"] == 3
+        assert data["summary"]["total_stops"] == 3
+        assert data["summary"]["status_breakdown"] == {"ACTIVE": 2, "INACTIVE": 1}
+        assert data["summary"]["stop_type_breakdown"] == {"ACCOMMODATION": 1, "FOOD": 2}
+
+
+    def test_get_trip_complete_etag(self, client: TestClient, auth_headers: dict, test_trip: Trip, test_day, test_place, db_session):
+        """Test the complete view answers 304 until a stop changes"""
+        from app.models.stop import Stop, StopKind
+
+        response = client.get(f"/trips/{test_trip.id}/complete", headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        conditional = {**auth_headers, "If-None-Match": etag}
+        response = client.get(f"/trips/{test_trip.id}/complete", headers=conditional)
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+        # Adding a stop does not touch the trip row but must change the ETag
+        db_session.add(Stop(day_id=test_day.id, trip_id=test_trip.id, place_id=test_place.id, seq=1, kind=StopKind.START))
+        db_session.commit()
+        response = client.get(f"/trips/{test_trip.id}/complete", headers=conditional)
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_get_trip_complete_etag_tracks_sub_second_edits(self, client: TestClient, auth_headers: dict, test_trip: Trip, test_day, test_place, db_session):
+        """Test a second edit within the same second still changes the ETag"""
+        from datetime import datetime, timedelta
+
+        from app.models.stop import Stop, StopKind
+
+        stop = Stop(day_id=test_day.id, trip_id=test_trip.id, place_id=test_place.id, seq=1, kind=StopKind.START)
+        db_session.add(stop)
+        db_session.commit()
+        url = f"/trips/{test_trip.id}/complete"
+
+        def etag_after(update):
+            update()
+            db_session.commit()
+            return client.get(url, headers=auth_headers).headers["etag"]
+
+        second = datetime(2026, 1, 1, 12, 0, 0)
+        first = etag_after(lambda: setattr(stop, "updated_at", second))
+        # A second edit inside the same second
+        same_second = etag_after(lambda: setattr(stop, "updated_at", second + timedelta(microseconds=500)))
+        assert same_second != first
+
+    def test_get_trip_complete_other_owner(self, client: TestClient, test_trip: Trip, db_session):
+        """Test the complete view tells another user's trip (403) from a missing one (404)"""
+        other_user = User(email="other@example.com", display_name="Other User")
+        db_session.add(other_user)
+        db_session.commit()
+        other_headers = {"Authorization": f"Bearer fake_token_{other_user.id}"}
+
+        response = client.get(f"/trips/{test_trip.id}/complete", headers=other_headers)
+        assert response.status_code == 403
+
+        response = client.get("/trips/missing/complete", headers=other_headers)
+        assert response.status_code == 404
+
+
 class TestTripsUpdate:
     """Test trip update endpoint"""
 
@@ -269,6 +696,39 @@ class TestTripsUpdate:
 
         assert data["title"] == "Updated Trip Title"
 
+    def test_update_trip_reload_skips_users_join(self, client: TestClient, auth_headers: dict, test_trip: Trip, test_user):
+        """Test updating is one UPDATE plus a trips reload without a users JOIN"""
+        from tests.conftest import test_engine
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", capture)
+        try:
+            response = client.patch(f"/trips/{test_trip.id}", json={"title": "Renamed"}, headers=auth_headers)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", capture)
+
+        assert response.status_code == 200
+        assert response.json()["created_by_user"]["email"] == test_user.email
+        # Auth lookup, UPDATE, trip reload, members
+        assert len(statements) == 4
+        assert statements[1].startswith("UPDATE trips")
+        assert "JOIN" not in statements[2]
+
+    def test_update_owned_trip_commits_with_dirty_session(self, db_session, test_trip: Trip, test_user):
+        """Test the trip UPDATE is committed even when other objects are dirty"""
+        from app.api.trips.router import _update_owned_trip
+
+        test_user.display_name = "Changed elsewhere"
+        assert _update_owned_trip(db_session, Trip.id == test_trip.id, test_user.id, {"title": "Committed"})
+        db_session.rollback()
+
+        db_session.expire_all()
+        assert db_session.get(Trip, test_trip.id).title == "Committed"
+
     def test_update_trip_multiple_fields(self, client: TestClient, auth_headers: dict, test_trip: Trip):
         """Test updating multiple fields of a trip"""
         update_data = {
@@ -339,3 +799,50 @@ class TestTripsArchive:
         response = client.post("/trips/nonexistent-trip-id/publish", headers=auth_headers)
 
         assert response.status_code == 404
+
+    def test_archive_and_publish_require_ownership(
+        self, client: TestClient, db_session, test_trip: Trip
+    ):
+        """Test that another user cannot archive or publish a trip"""
+        other_user = User(email="other@example.com", display_name="Other User")
+        db_session.add(other_user)
+        db_session.commit()
+        other_headers = {"Authorization": f"Bearer fake_token_{other_user.id}"}
+
+        response = client.post(f"/trips/{test_trip.id}/archive", headers=other_headers)
+        assert response.status_code == 404
+
+        response = client.post(f"/trips/{test_trip.id}/publish", headers=other_headers)
+        assert response.status_code == 404
+
+
+class TestTripsDelete:
+    """Test trip soft deletion endpoint"""
+
+    def test_delete_trip_by_slug(self, client: TestClient, auth_headers: dict, db_session, test_trip: Trip):
+        """Test deleting a trip by slug soft-deletes it"""
+        response = client.delete(f"/trips/{test_trip.slug}", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == {"message": "Trip deleted"}
+        db_session.refresh(test_trip)
+        assert test_trip.deleted_at is not None
+
+        # A deleted trip can neither be fetched nor deleted again
+        response = client.get(f"/trips/{test_trip.id}", headers=auth_headers)
+        assert response.status_code == 404
+        response = client.delete(f"/trips/{test_trip.id}", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_delete_trip_requires_ownership(self, client: TestClient, db_session, test_trip: Trip):
+        """Test that another user's delete leaves the trip untouched"""
+        other_user = User(email="other@example.com", display_name="Other User")
+        db_session.add(other_user)
+        db_session.commit()
+        other_headers = {"Authorization": f"Bearer fake_token_{other_user.id}"}
+
+        response = client.delete(f"/trips/{test_trip.id}", headers=other_headers)
+
+        assert response.status_code == 404
+        db_session.refresh(test_trip)
+        assert test_trip.deleted_at is None